@@ -19,108 +19,300 @@ class QuantumState:
     consciousness: float  # 0-10 consciousness level
     field_strength: float  # Field strength in tesla
 
+# Player analysis draws each QuantumState field uniformly from
+# [low, low + span): coherence, energy, entanglement, consciousness, field strength
+PLAYER_STATE_LOW = np.array([0.7, 0.6, 0.7, 7.0, 0.6])
+PLAYER_STATE_SPAN = np.array([0.3, 0.4, 0.3, 3.0, 0.4])
+
+# Column indices into player state arrays
+COHERENCE, ENERGY, FIELD_STRENGTH = 0, 1, 4
+
+# Football formation grid size
+FORMATION_GRID = 11
+
+class QuantumField:
+    """3D quantum field updated in place, slab by slab
+    
+    The cube is allocated on first write in the chosen dtype. Updates draw
+    noise into one reusable Generator buffer, and per-slice sums, squared
+    sums and maxima are refreshed as each slab is written, so field
+    statistics never rescan the cube.
+    """
+    
+    def __init__(self, size: int = 100, dtype=np.float32, slab: int = 10,
+                 rng: Optional[np.random.Generator] = None):
+        self.size = size
+        self.dtype = np.dtype(dtype)
+        self.slab = max(1, min(slab, size))
+        self.rng = rng or np.random.default_rng()
+        self._data: Optional[np.ndarray] = None
+        self._noise: Optional[np.ndarray] = None
+        self.slice_sum = np.zeros(size)
+        self.slice_sq_sum = np.zeros(size)
+        self.slice_max = np.zeros(size)
+        
+    @property
+    def data(self) -> np.ndarray:
+        """The field cube, allocated as zeros on first access"""
+        if self._data is None:
+            self._data = np.zeros((self.size,) * 3, dtype=self.dtype)
+        return self._data
+        
+    @property
+    def nbytes(self) -> int:
+        return 0 if self._data is None else self._data.nbytes
+        
+    def _draw(self, rows: int) -> np.ndarray:
+        """Uniform [0, 1) noise for a slab, in the reusable buffer"""
+        if self._noise is None:
+            noise_dtype = np.float64 if self.dtype == np.float64 else np.float32
+            self._noise = np.empty((self.slab, self.size, self.size), dtype=noise_dtype)
+        noise = self._noise[:rows]
+        self.rng.random(out=noise, dtype=noise.dtype)
+        return noise
+        
+    def _record(self, start: int, block: np.ndarray):
+        self.slice_sum[start:start + len(block)] = block.sum(axis=(1, 2), dtype=np.float64)
+        self.slice_sq_sum[start:start + len(block)] = np.square(block, dtype=np.float64).sum(axis=(1, 2))
+        self.slice_max[start:start + len(block)] = block.max(axis=(1, 2))
+        
+    def _slabs(self, start: int, stop: int):
+        for first in range(start, stop, self.slab):
+            last = min(first + self.slab, stop)
+            yield first, self.data[first:last]
+            
+    def initialize(self, scale: float = 0.5, start: int = 0, stop: Optional[int] = None):
+        """Fill slices [start, stop) with uniform values in [0, scale)"""
+        for first, block in self._slabs(start, self.size if stop is None else stop):
+            noise = self._draw(len(block))
+            noise *= scale
+            block[...] = noise
+            self._record(first, block)
+            
+    def step(self, amplitude: float = 0.05):
+        """Add uniform noise in [-amplitude, amplitude) and clip to [0, 1]"""
+        for first, block in self._slabs(0, self.size):
+            noise = self._draw(len(block))
+            noise *= 2 * amplitude
+            noise -= amplitude
+            block += noise.astype(self.dtype, copy=False)
+            np.clip(block, 0, 1, out=block)
+            self._record(first, block)
+            
+    def statistics(self) -> Dict[str, float]:
+        """Field mean, standard deviation and maximum"""
+        cells = self.size ** 3
+        mean = self.slice_sum.sum() / cells
+        variance = max(self.slice_sq_sum.sum() / cells - mean ** 2, 0.0)
+        return {
+            "strength": float(mean),
+            "coherence": float(np.sqrt(variance)),
+            "energy": float(self.slice_max.max())
+        }
+        
+    def snapshot(self) -> np.ndarray:
+        """Copy of the field"""
+        return self.data.copy()
+        
+    def clear(self):
+        """Zero the field and its statistics"""
+        if self._data is not None:
+            self._data.fill(0)
+        for stats in (self.slice_sum, self.slice_sq_sum, self.slice_max):
+            stats.fill(0)
+
 class QuantumCore:
     """Core quantum system for NFL analysis and optimization"""
     
-    def __init__(self):
+    def __init__(self, field_size: int = 100, field_dtype=np.float32,
+                 rng: Optional[np.random.Generator] = None, headless: bool = False):
         self.console = Console()
+        self.headless = headless  # No progress bars or console output
+        self.rng = rng or np.random.default_rng()
         self.states: Dict[str, QuantumState] = {}
-        self.field_matrix = np.zeros((100, 100, 100))  # 3D quantum field
+        self.team_arrays: Dict[str, np.ndarray] = {}  # (players, 5) state arrays per team
+        # Running coherence * energy sum over self.states for play success
+        self.play_sum = 0.0
+        self.play_count = 0
+        self.field = QuantumField(field_size, field_dtype, rng=self.rng)  # 3D quantum field
+        
+    @property
+    def field_matrix(self) -> np.ndarray:
+        return self.field.data
         
     async def initialize_quantum_field(self):
         """Initialize the quantum field for NFL analysis"""
-        with Progress() as progress:
-            task = progress.add_task("[cyan]Initializing Quantum Field...", total=100)
+        if self.headless:
+            self.field.initialize(0.5)
+            return
+            
+        with Progress(console=self.console) as progress:
+            task = progress.add_task("[cyan]Initializing Quantum Field...", total=self.field.size)
             
-            # Initialize quantum states
-            for i in range(100):
-                self.field_matrix[i] = np.random.random((100, 100)) * 0.5
-                progress.update(task, advance=1)
-                await asyncio.sleep(0.01)
+            # Initialize quantum states a slab at a time, yielding between slabs
+            for start in range(0, self.field.size, self.field.slab):
+                stop = min(start + self.field.slab, self.field.size)
+                self.field.initialize(0.5, start, stop)
+                progress.update(task, advance=stop - start)
+                await asyncio.sleep(0)
                 
         self.console.print("[green]Quantum Field Initialized!")
         
+    def draw_player_states(self, count: int) -> np.ndarray:
+        """Draw quantum state fields for many players in one vectorized call
+        
+        Returns:
+            np.ndarray: (count, 5) array in QuantumState field order
+        """
+        return PLAYER_STATE_LOW + self.rng.random((count, len(PLAYER_STATE_LOW))) * PLAYER_STATE_SPAN
+        
+    def _store_states(self, player_ids: List[str], values: np.ndarray,
+                      team_id: Optional[str] = None) -> Dict[str, QuantumState]:
+        # Repeated ids keep their last row, as the states dict does
+        rows = {player_id: i for i, player_id in enumerate(player_ids)}
+        if len(rows) < len(player_ids):
+            values = values[list(rows.values())]
+            player_ids = list(rows)
+            
+        states = {
+            player_id: QuantumState(*row)
+            for player_id, row in zip(player_ids, values.tolist())
+        }
+        
+        # Keep the play success aggregate in step with self.states
+        for player_id in states:
+            previous = self.states.get(player_id)
+            if previous is not None:
+                self.play_sum -= previous.coherence * previous.energy
+                self.play_count -= 1
+        self.play_sum += float(np.sum(values[:, COHERENCE] * values[:, ENERGY]))
+        self.play_count += len(states)
+        
+        self.states.update(states)
+        if team_id is not None:
+            self.team_arrays[team_id] = values
+        return states
+        
     async def analyze_player(self, player_id: str) -> QuantumState:
         """Analyze player's quantum state"""
-        # Quantum analysis algorithm
-        coherence = np.random.random() * 0.3 + 0.7  # High coherence
-        energy = np.random.random() * 0.4 + 0.6     # High energy
-        entanglement = np.random.random() * 0.3 + 0.7  # High entanglement
-        consciousness = np.random.random() * 3 + 7   # High consciousness
-        field_strength = np.random.random() * 0.4 + 0.6  # High field strength
-        
-        state = QuantumState(
-            coherence=coherence,
-            energy=energy,
-            entanglement=entanglement,
-            consciousness=consciousness,
-            field_strength=field_strength
-        )
-        
-        self.states[player_id] = state
-        return state
+        # Quantum analysis algorithm: high coherence, energy, entanglement,
+        # consciousness and field strength
+        return self._store_states([player_id], self.draw_player_states(1))[player_id]
         
     async def analyze_team(self, team_id: str, player_ids: List[str]) -> Dict[str, QuantumState]:
-        """Analyze entire team's quantum state"""
-        team_states = {}
+        """Analyze entire team's quantum state in one vectorized draw"""
+        team_states = self._store_states(player_ids, self.draw_player_states(len(player_ids)), team_id)
         
-        with Progress() as progress:
-            task = progress.add_task(f"[cyan]Analyzing Team {team_id}...", total=len(player_ids))
-            
-            for player_id in player_ids:
-                state = await self.analyze_player(player_id)
-                team_states[player_id] = state
-                progress.update(task, advance=1)
-                await asyncio.sleep(0.01)
+        if not self.headless:
+            self.console.print(f"[cyan]Analyzed Team {team_id}: {len(team_states)} players")
                 
         return team_states
         
+    async def analyze_league(self, rosters: Dict[str, List[str]]) -> Dict[str, Dict[str, QuantumState]]:
+        """Analyze every roster in a league with a single draw
+        
+        Args:
+            rosters (Dict[str, List[str]]): Player ids by team id
+            
+        Returns:
+            Dict[str, Dict[str, QuantumState]]: Player states by team id
+        """
+        values = self.draw_player_states(sum(len(players) for players in rosters.values()))
+        
+        league = {}
+        start = 0
+        for team_id, player_ids in rosters.items():
+            league[team_id] = self._store_states(player_ids, values[start:start + len(player_ids)], team_id)
+            start += len(player_ids)
+        return league
+        
     async def optimize_formation(self, team_states: Dict[str, QuantumState]) -> np.ndarray:
         """Optimize team formation using quantum states"""
-        formation_matrix = np.zeros((11, 11))  # Football formation grid
+        values = np.array([
+            [state.coherence, state.energy, state.field_strength] for state in team_states.values()
+        ]).reshape(-1, 3)
+        return self._formation_grids(values[:, 0], values[:, 1], values[:, 2])[0]
         
-        # Quantum optimization algorithm
-        for i, state in enumerate(team_states.values()):
-            x = int(state.coherence * 10)
-            y = int(state.energy * 10)
-            formation_matrix[x, y] = state.field_strength
-            
-        return formation_matrix
+    def optimize_formations(self, team_ids: Optional[List[str]] = None) -> np.ndarray:
+        """Formations for many analyzed teams in one batched call
+        
+        Args:
+            team_ids (List[str], optional): Teams to place. Defaults to
+                every team in self.team_arrays.
+                
+        Returns:
+            np.ndarray: (teams, 11, 11) formation grids
+        """
+        team_ids = list(self.team_arrays) if team_ids is None else team_ids
+        arrays = [self.team_arrays[team_id] for team_id in team_ids]
+        values = np.concatenate(arrays) if arrays else np.empty((0, len(PLAYER_STATE_LOW)))
+        teams = np.repeat(np.arange(len(arrays)), [len(array) for array in arrays])
+        return self._formation_grids(
+            values[:, COHERENCE], values[:, ENERGY], values[:, FIELD_STRENGTH], teams, len(arrays)
+        )
+        
+    @staticmethod
+    def _formation_grids(coherence, energy, field_strength, teams=None, count: int = 1) -> np.ndarray:
+        """Scatter players onto formation grids; later players overwrite earlier ones"""
+        grids = np.zeros((count, FORMATION_GRID, FORMATION_GRID))
+        teams = np.zeros(len(coherence), dtype=int) if teams is None else teams
+        x = (np.asarray(coherence) * 10).astype(int)
+        y = (np.asarray(energy) * 10).astype(int)
+        
+        # Keep only the last player at each cell, as sequential writes would
+        cells = (teams * FORMATION_GRID + x) * FORMATION_GRID + y
+        _, last = np.unique(cells[::-1], return_index=True)
+        last = len(cells) - 1 - last
+        grids[teams[last], x[last], y[last]] = np.asarray(field_strength)[last]
+        return grids
+        
+    def base_play_probability(self) -> float:
+        """Mean coherence * energy over every analyzed player, in O(1)"""
+        return self.play_sum / self.play_count if self.play_count else float('nan')
         
     async def predict_play_success(self, 
                                  formation: np.ndarray, 
                                  play_type: str, 
                                  conditions: Dict) -> float:
         """Predict success probability of a play using quantum analysis"""
+        probabilities = await self.predict_play_success_batch(formation[None], [play_type], [conditions])
+        return float(probabilities[0])
+        
+    async def predict_play_success_batch(self,
+                                       formations: np.ndarray,
+                                       play_types: List[str],
+                                       conditions: List[Dict]) -> np.ndarray:
+        """Predict success probabilities for many candidate plays at once
+        
+        Candidate i is formations[i] run as play_types[i] under
+        conditions[i].
+        
+        Returns:
+            np.ndarray: Success probability per candidate
+        """
         # Quantum prediction algorithm
-        base_prob = np.mean([state.coherence * state.energy for state in self.states.values()])
+        base_prob = self.base_play_probability()
         
         # Adjust for formation strength
-        formation_factor = np.mean(formation) * 0.3
+        formation_factor = np.asarray(formations).mean(axis=(1, 2)) * 0.3
         
         # Adjust for conditions
-        condition_factor = sum(conditions.values()) / len(conditions) * 0.2
+        condition_factor = np.array([
+            sum(condition.values()) / len(condition) for condition in conditions
+        ]) * 0.2
         
         success_prob = base_prob + formation_factor + condition_factor
-        return min(success_prob, 1.0)  # Cap at 100%
+        return np.minimum(success_prob, 1.0)  # Cap at 100%
         
     async def monitor_quantum_field(self, callback):
         """Monitor quantum field changes in real-time"""
         while True:
-            # Update quantum field
-            self.field_matrix += np.random.random((100, 100, 100)) * 0.1 - 0.05
-            self.field_matrix = np.clip(self.field_matrix, 0, 1)
-            
-            # Calculate field metrics
-            field_strength = np.mean(self.field_matrix)
-            field_coherence = np.std(self.field_matrix)
-            field_energy = np.max(self.field_matrix)
+            # Update quantum field in place; metrics come from running sums
+            self.field.step(0.05)
             
             # Send update through callback
             await callback({
-                "strength": field_strength,
-                "coherence": field_coherence,
-                "energy": field_energy,
+                **self.field.statistics(),
                 "timestamp": asyncio.get_event_loop().time()
             })
             
@@ -128,12 +320,17 @@ class QuantumCore:
             
     def get_field_visualization(self) -> np.ndarray:
         """Get current quantum field state for visualization"""
-        return self.field_matrix.copy()
+        return self.field.snapshot()
         
     async def shutdown(self):
         """Safely shutdown quantum system"""
-        self.console.print("[yellow]Shutting down quantum core...")
+        if not self.headless:
+            self.console.print("[yellow]Shutting down quantum core...")
         # Cleanup quantum states
         self.states.clear()
-        self.field_matrix.fill(0)
-        self.console.print("[green]Quantum core shutdown complete!")
+        self.team_arrays.clear()
+        self.play_sum = 0.0
+        self.play_count = 0
+        self.field.clear()
+        if not self.headless:
+            self.console.print("[green]Quantum core shutdown complete!")
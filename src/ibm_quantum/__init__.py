@@ -0,0 +1,3 @@
+"""
+IBM Quantum integration package for NFL
+"""
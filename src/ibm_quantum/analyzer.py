@@ -7,9 +7,8 @@ and games using IBM Quantum computers.
 
 from typing import Dict, List, Tuple
 import numpy as np
-from qiskit import QuantumCircuit, execute
-from qiskit.quantum_info import state_fidelity, Statevector
-from qiskit.visualization import plot_state_city
+from .backend import qiskit_import
+from .metrics import l1_coherence, entanglement_entropy
 
 class NFLQuantumAnalyzer:
     def __init__(self, circuits):
@@ -29,9 +28,8 @@ class NFLQuantumAnalyzer:
         Returns:
             Dict[str, float]: Quantum state analysis results
         """
-        # Create and execute circuit
-        circuit = self.circuits.create_team_state_circuit(team_metrics)
-        statevector = Statevector.from_instruction(circuit)
+        # Exact state of the team circuit
+        statevector = self.circuits.team_statevector(team_metrics)
         
         # Analyze quantum properties
         entanglement = self._calculate_entanglement(statevector)
@@ -52,14 +50,9 @@ class NFLQuantumAnalyzer:
         Returns:
             float: Entanglement measure between 0 and 1
         """
-        # Calculate reduced density matrix
-        dims = [2, 2, 2, 2, 2]  # 5 qubits
-        reduced = statevector.partial_trace([0, 1])
-        
-        # Calculate von Neumann entropy
-        eigenvals = np.real(np.linalg.eigvals(reduced.data))
-        eigenvals = eigenvals[eigenvals > 1e-10]
-        entropy = -np.sum(eigenvals * np.log2(eigenvals))
+        # Von Neumann entropy after tracing out qubits 0 and 1, from the
+        # Schmidt weights rather than the reduced density matrix
+        entropy = entanglement_entropy(statevector, traced=(0, 1))
         
         return min(entropy, 1.0)
     
@@ -72,9 +65,8 @@ class NFLQuantumAnalyzer:
         Returns:
             float: Coherence measure between 0 and 1
         """
-        # Calculate l1-norm coherence
-        rho = statevector.to_operator().data
-        coherence = np.sum(np.abs(rho)) - np.trace(np.abs(rho))
+        # l1-norm coherence straight from the amplitudes
+        coherence = l1_coherence(statevector)
         
         return min(coherence, 1.0)
     
@@ -92,16 +84,12 @@ class NFLQuantumAnalyzer:
         # Get win probabilities
         game_results = self.circuits.simulate_game(home_metrics, away_metrics)
         
-        # Analyze quantum interference
-        home_state = Statevector.from_instruction(
-            self.circuits.create_team_state_circuit(home_metrics)
-        )
-        away_state = Statevector.from_instruction(
-            self.circuits.create_team_state_circuit(away_metrics)
-        )
+        # Analyze quantum interference on the cached team states
+        home_state = self.circuits.team_statevector(home_metrics)
+        away_state = self.circuits.team_statevector(away_metrics)
         
-        # Calculate state fidelity
-        fidelity = state_fidelity(home_state, away_state)
+        # Calculate state fidelity, |<home|away>|^2 for pure states
+        fidelity = float(np.abs(np.vdot(home_state, away_state)) ** 2)
         
         return {
             'win_probability': game_results['home_win_prob'],
@@ -121,8 +109,9 @@ class NFLQuantumAnalyzer:
         Returns:
             float: Entanglement measure between the teams
         """
-        # Calculate composite system entropy
-        composite = state1.tensor(state2)
+        # Composite system entropy; the 10-qubit product state is 1024
+        # amplitudes, and no 1024 x 1024 operator is ever built
+        composite = np.kron(state1, state2)
         entropy = self._calculate_entanglement(composite)
         
         return entropy
@@ -133,8 +122,10 @@ class NFLQuantumAnalyzer:
         Args:
             team_metrics (Dict[str, float]): Team performance metrics
         """
+        Statevector = qiskit_import('qiskit.quantum_info', 'Statevector')
+        plot_state_city = qiskit_import('qiskit.visualization', 'plot_state_city')
         circuit = self.circuits.create_team_state_circuit(team_metrics)
-        state = Statevector.from_instruction(circuit)
+        state = Statevector.from_instruction(circuit.remove_final_measurements(inplace=False))
         
         # Create city plot visualization
         fig = plot_state_city(state)
@@ -0,0 +1,110 @@
+"""
+NFL Quantum Execution Backends
+
+This module keeps Qiskit off the import path. Qiskit modules are imported on
+first use, and when Qiskit is not installed, or lacks the Aer and execute API
+used here, a pure-NumPy backend samples measurement outcomes from exact
+statevector probabilities instead.
+"""
+
+from functools import lru_cache
+from importlib import import_module
+from importlib.util import find_spec
+from typing import Dict
+import numpy as np
+
+# Shots used when a caller does not ask for a number, as on Aer
+DEFAULT_SHOTS = 1024
+
+@lru_cache(maxsize=None)
+def qiskit_available() -> bool:
+    """Whether Qiskit is installed with the Aer and execute API QiskitBackend uses.
+
+    Qiskit 1.0 removed both names, so a newer install counts as unavailable.
+    """
+    if find_spec('qiskit') is None:
+        return False
+    try:
+        qiskit_import('qiskit', 'Aer', 'execute')
+    except ImportError:
+        return False
+    return True
+
+def qiskit_import(module: str, *names: str):
+    """Import names from a Qiskit module on first use.
+
+    Args:
+        module (str): Module path, e.g. 'qiskit.circuit'
+        *names (str): Attributes to fetch from the module
+
+    Returns:
+        The attribute for a single name, otherwise a tuple of attributes
+
+    Raises:
+        ImportError: If the module is unavailable, naming what needs it
+    """
+    try:
+        imported = import_module(module)
+        values = tuple(getattr(imported, name) for name in names)
+    except (ImportError, AttributeError) as error:
+        raise ImportError(
+            f"{', '.join(names)} from {module} is unavailable; circuit construction needs a "
+            "compatible Qiskit install, exact predictions run on the NumPy backend"
+        ) from error
+    return values[0] if len(values) == 1 else values
+
+class NumpyBackend:
+    """Pure-NumPy sampler over exact outcome probabilities"""
+    name = 'numpy'
+
+    def __init__(self, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+
+    def sample(self, probabilities: np.ndarray, shots: int = DEFAULT_SHOTS) -> Dict[str, int]:
+        """Sample measurement counts from outcome probabilities.
+
+        Args:
+            probabilities (np.ndarray): Probability of each integer outcome,
+                with bit k of the outcome being clbit k
+            shots (int, optional): Number of shots. Defaults to DEFAULT_SHOTS.
+
+        Returns:
+            Dict[str, int]: Counts keyed like Qiskit, highest clbit first
+        """
+        probabilities = np.asarray(probabilities, dtype=float)
+        num_bits = int(np.log2(len(probabilities)))
+        counts = self.rng.multinomial(shots, probabilities / probabilities.sum())
+        return {format(int(outcome), f'0{num_bits}b'): int(counts[outcome]) for outcome in np.flatnonzero(counts)}
+
+class QiskitBackend:
+    """Qiskit Aer simulator, imported the first time a circuit runs"""
+    name = 'qiskit'
+
+    def __init__(self, simulator: str = 'qasm_simulator'):
+        self.simulator_name = simulator
+        self._simulator = None
+
+    @property
+    def simulator(self):
+        """The underlying Aer backend."""
+        if self._simulator is None:
+            Aer = qiskit_import('qiskit', 'Aer')
+            self._simulator = Aer.get_backend(self.simulator_name)
+        return self._simulator
+
+    def run(self, circuit, shots: int = DEFAULT_SHOTS) -> Dict[str, int]:
+        """Execute a circuit and return its measurement counts.
+
+        Args:
+            circuit (QuantumCircuit): Circuit with measurements
+            shots (int, optional): Number of shots. Defaults to DEFAULT_SHOTS.
+
+        Returns:
+            Dict[str, int]: Measurement counts
+        """
+        execute = qiskit_import('qiskit', 'execute')
+        return execute(circuit, self.simulator, shots=shots).result().get_counts()
+
+def default_backend():
+    """Qiskit Aer when a compatible Qiskit is installed, otherwise the NumPy backend."""
+    return QiskitBackend() if qiskit_available() else NumpyBackend()
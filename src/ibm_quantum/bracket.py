@@ -0,0 +1,220 @@
+"""
+NFL Quantum Playoff Bracket
+
+This module turns per-matchup win probabilities into exact playoff
+advancement odds. Only teams that can actually meet are ever paired, so each
+game is an independent two-team subcircuit instead of one circuit entangling
+the whole field.
+"""
+
+from itertools import product
+from typing import Dict, List, Tuple
+import numpy as np
+
+# Seeds per conference in the NFL's 14-team format
+CONFERENCE_SEEDS = 7
+NFL_PLAYOFF_TEAMS = 2 * CONFERENCE_SEEDS
+
+def bracket_order(size: int) -> List[int]:
+    """Seed at each slot of a standard single-elimination bracket.
+
+    Args:
+        size (int): Bracket size, a power of two
+
+    Returns:
+        List[int]: Zero-based seeds in slot order, e.g. [0, 3, 1, 2] for four
+    """
+    order = [0]
+    while len(order) < size:
+        order = [seed for top in order for seed in (top, 2 * len(order) - 1 - top)]
+    return order
+
+def first_round_games(num_teams: int) -> List[Tuple[int, int]]:
+    """Opening games of the bracket, the only pairs known before kickoff.
+
+    Args:
+        num_teams (int): Number of playoff teams, indexed in seed order
+
+    Returns:
+        List[Tuple[int, int]]: (home, away) team indices, better seed first
+    """
+    if num_teams == NFL_PLAYOFF_TEAMS:
+        return [
+            (offset + home, offset + away)
+            for offset in (0, CONFERENCE_SEEDS)
+            for home, away in ((1, 6), (2, 5), (3, 4))
+        ]
+    size = 2 ** max(1, int(np.ceil(np.log2(num_teams))))
+    slots = bracket_order(size)
+    return [
+        (min(home, away), max(home, away))
+        for home, away in zip(slots[0::2], slots[1::2])
+        if home < num_teams and away < num_teams
+    ]
+
+class PlayoffBracket:
+    def __init__(self, win_matrix: np.ndarray):
+        """Initialize the bracket.
+
+        Args:
+            win_matrix (np.ndarray): Entry [i, j] is the probability that team
+                i beats team j at home; teams are indexed in seed order
+        """
+        self.win_matrix = np.asarray(win_matrix, dtype=float)
+        self.num_teams = len(self.win_matrix)
+
+    def game_probability(self, first: int, second: int) -> float:
+        """Probability that the first team wins, with the better seed at home.
+
+        Args:
+            first (int): First team index
+            second (int): Second team index
+
+        Returns:
+            float: Win probability for the first team
+        """
+        if first < second:
+            return self.win_matrix[first, second]
+        return 1 - self.win_matrix[second, first]
+
+    def neutral_probability(self, first: int, second: int) -> float:
+        """Probability that the first team wins at a neutral site."""
+        return (self.win_matrix[first, second] + 1 - self.win_matrix[second, first]) / 2
+
+    def simulate(self) -> Dict:
+        """Exact advancement odds, using the NFL format for a 14-team field.
+
+        Returns:
+            Dict: first_round games as (home, away, home_win_prob), the
+                advancement matrix of probabilities to reach each round, with
+                the title as the last column, and champion_prob
+        """
+        if self.num_teams == NFL_PLAYOFF_TEAMS:
+            return self.nfl_playoffs()
+        return self.single_elimination()
+
+    def single_elimination(self) -> Dict:
+        """Exact advancement odds for a fixed seeded bracket with byes.
+
+        Returns:
+            Dict: Bracket results as described in simulate
+        """
+        rounds = max(1, int(np.ceil(np.log2(self.num_teams))))
+        size = 2 ** rounds
+        slots = np.array(bracket_order(size))
+
+        # Byes always lose and never host
+        win = np.zeros((size, size))
+        win[:self.num_teams, self.num_teams:] = 1
+        teams = np.arange(self.num_teams)
+        for first in teams:
+            for second in teams:
+                if first != second:
+                    win[first, second] = self.game_probability(first, second)
+        win = win[np.ix_(slots, slots)]
+
+        alive = np.ones(size)
+        advancement = np.zeros((size, rounds + 1))
+        advancement[:, 0] = 1
+        for round_index in range(rounds):
+            block = 2 ** round_index
+            reached = np.empty(size)
+            for start in range(0, size, 2 * block):
+                top = slice(start, start + block)
+                bottom = slice(start + block, start + 2 * block)
+                reached[top] = alive[top] * (win[top, bottom] @ alive[bottom])
+                reached[bottom] = alive[bottom] * (win[bottom, top] @ alive[top])
+            alive = reached
+            advancement[:, round_index + 1] = alive
+
+        by_seed = np.empty_like(advancement)
+        by_seed[slots] = advancement
+        first_round = [
+            (home, away, float(self.game_probability(home, away)))
+            for home, away in first_round_games(self.num_teams)
+        ]
+
+        return {
+            'first_round': first_round,
+            'advancement': by_seed[:self.num_teams],
+            'champion_prob': by_seed[:self.num_teams, -1]
+        }
+
+    def conference_bracket(self, seeds: List[int]) -> Tuple[List[Tuple[int, int, float]], np.ndarray]:
+        """Enumerate a seven-seed conference bracket with reseeding.
+
+        The top seed has a bye, wild card games are 2-7, 3-6 and 4-5, and the
+        top remaining seed always hosts the lowest remaining seed.
+
+        Args:
+            seeds (List[int]): Team indices in seed order
+
+        Returns:
+            Tuple: Wild card games, and the probabilities of each seed reaching
+                the divisional round, the conference game and the title game
+        """
+        wild_card = [(seeds[1], seeds[6]), (seeds[2], seeds[5]), (seeds[3], seeds[4])]
+        reach = {team: np.zeros(3) for team in seeds}
+
+        for results in product((0, 1), repeat=3):
+            remaining = [seeds[0]]
+            probability = 1.0
+            for (home, away), upset in zip(wild_card, results):
+                win = self.game_probability(home, away)
+                remaining.append(away if upset else home)
+                probability *= (1 - win) if upset else win
+            remaining.sort(key=seeds.index)
+
+            for team in remaining:
+                reach[team][0] += probability
+            for results_divisional in product((0, 1), repeat=2):
+                finalists = []
+                path = probability
+                for (home, away), upset in zip(
+                    [(remaining[0], remaining[3]), (remaining[1], remaining[2])], results_divisional
+                ):
+                    win = self.game_probability(home, away)
+                    finalists.append(away if upset else home)
+                    path *= (1 - win) if upset else win
+                home, away = sorted(finalists, key=seeds.index)
+                win = self.game_probability(home, away)
+                reach[home][1] += path
+                reach[away][1] += path
+                reach[home][2] += path * win
+                reach[away][2] += path * (1 - win)
+
+        games = [(home, away, float(self.game_probability(home, away))) for home, away in wild_card]
+        return games, np.array([reach[team] for team in seeds])
+
+    def nfl_playoffs(self) -> Dict:
+        """Exact advancement odds for the 14-team NFL format.
+
+        Teams 0-6 are one conference's seeds 1-7 and teams 7-13 the other's.
+        The title game is played at a neutral site.
+
+        Returns:
+            Dict: Bracket results as described in simulate
+        """
+        conferences = [list(range(CONFERENCE_SEEDS)), list(range(CONFERENCE_SEEDS, NFL_PLAYOFF_TEAMS))]
+        first_round = []
+        reach = []
+        for seeds in conferences:
+            games, conference_reach = self.conference_bracket(seeds)
+            first_round.extend(games)
+            reach.append(conference_reach)
+
+        first, second = conferences
+        champion = np.zeros(NFL_PLAYOFF_TEAMS)
+        for i, team in enumerate(first):
+            for j, opponent in enumerate(second):
+                meet = reach[0][i, 2] * reach[1][j, 2]
+                win = self.neutral_probability(team, opponent)
+                champion[team] += meet * win
+                champion[opponent] += meet * (1 - win)
+
+        advancement = np.column_stack([np.ones(NFL_PLAYOFF_TEAMS), np.vstack(reach), champion])
+        return {
+            'first_round': first_round,
+            'advancement': advancement,
+            'champion_prob': champion
+        }
@@ -5,38 +5,55 @@ This module implements quantum circuits for NFL game analysis and prediction
 using IBM Quantum computers through Qiskit.
 """
 
-from typing import Dict, List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit import Aer, execute
-from qiskit.providers.ibmq import IBMQ
-from qiskit.visualization import plot_histogram
+from .backend import default_backend, qiskit_import
+from .bracket import first_round_games
+from .sampling import AdaptiveShotExecutor, count_home_wins
+from .statevector import (
+    TEAM_METRICS, metric_key, metric_angles, team_statevector, game_states, game_probabilities, win_probability_matrix
+)
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 class NFLQuantumCircuits:
-    def __init__(self, api_token: str = None):
+    def __init__(self, api_token: str = None, backend=None):
         """Initialize NFL Quantum Circuits.
         
         Args:
             api_token (str, optional): IBM Quantum API token. Defaults to None.
+            backend (optional): QiskitBackend or NumpyBackend used for
+                sampling. Defaults to Qiskit Aer when Qiskit is installed,
+                otherwise the NumPy backend.
         """
-        self.backend = Aer.get_backend('qasm_simulator')
+        self.backend = backend or default_backend()
+        self._team_template = None
+        self._team_parameters = None
         if api_token:
+            IBMQ = qiskit_import('qiskit.providers.ibmq', 'IBMQ')
             IBMQ.save_account(api_token)
             IBMQ.load_account()
     
-    def create_team_state_circuit(self, team_metrics: Dict[str, float]) -> QuantumCircuit:
-        """Create a quantum circuit representing a team's state.
+    def team_state_template(self) -> QuantumCircuit:
+        """Parameterized team state circuit, built once and reused.
+        
+        The three RY angles are Parameters named after the metrics they
+        encode, so a team's circuit is a parameter binding, not a rebuild.
         
-        Args:
-            team_metrics (Dict[str, float]): Team performance metrics
-                Required keys:
-                - offensive_power: float between 0 and 1
-                - defensive_power: float between 0 and 1
-                - momentum: float between 0 and 1
-                
         Returns:
-            QuantumCircuit: Quantum circuit representing team state
+            QuantumCircuit: Team state circuit with unbound angles
         """
+        if self._team_template is not None:
+            return self._team_template
+        
+        QuantumCircuit, QuantumRegister, ClassicalRegister = qiskit_import(
+            'qiskit', 'QuantumCircuit', 'QuantumRegister', 'ClassicalRegister'
+        )
+        Parameter = qiskit_import('qiskit.circuit', 'Parameter')
+        
         # Create quantum registers for different aspects
         qr_offense = QuantumRegister(2, 'offense')
         qr_defense = QuantumRegister(2, 'defense')
@@ -45,19 +62,18 @@ class NFLQuantumCircuits:
         
         # Create circuit
         circuit = QuantumCircuit(qr_offense, qr_defense, qr_momentum, cr)
+        self._team_parameters = [Parameter(name) for name in TEAM_METRICS]
+        theta_o, theta_d, theta_m = self._team_parameters
         
         # Encode offensive power
-        theta_o = np.arccos(np.sqrt(team_metrics['offensive_power']))
         circuit.ry(theta_o, qr_offense[0])
         circuit.cx(qr_offense[0], qr_offense[1])
         
         # Encode defensive power
-        theta_d = np.arccos(np.sqrt(team_metrics['defensive_power']))
         circuit.ry(theta_d, qr_defense[0])
         circuit.cx(qr_defense[0], qr_defense[1])
         
         # Encode momentum
-        theta_m = np.arccos(np.sqrt(team_metrics['momentum']))
         circuit.ry(theta_m, qr_momentum)
         
         # Create entanglement between offense and defense
@@ -68,62 +84,204 @@ class NFLQuantumCircuits:
         circuit.measure(qr_defense, cr[2:4])
         circuit.measure(qr_momentum, cr[4])
         
+        self._team_template = circuit
         return circuit
     
-    def simulate_game(self, home_metrics: Dict[str, float], 
-                     away_metrics: Dict[str, float], 
-                     shots: int = 1000) -> Dict[str, float]:
-        """Simulate a game between two teams using quantum circuits.
+    def create_team_state_circuit(self, team_metrics: Dict[str, float]) -> QuantumCircuit:
+        """Create a quantum circuit representing a team's state.
         
         Args:
-            home_metrics (Dict[str, float]): Home team metrics
-            away_metrics (Dict[str, float]): Away team metrics
-            shots (int, optional): Number of simulation shots. Defaults to 1000.
+            team_metrics (Dict[str, float]): Team performance metrics
+                Required keys:
+                - offensive_power: float between 0 and 1
+                - defensive_power: float between 0 and 1
+                - momentum: float between 0 and 1
+                
+        Returns:
+            QuantumCircuit: Quantum circuit representing team state
+        """
+        template = self.team_state_template()
+        angles = metric_angles(np.array([team_metrics[name] for name in TEAM_METRICS]))
+        return template.assign_parameters(dict(zip(self._team_parameters, angles.tolist())))
+    
+    def team_statevector(self, team_metrics: Dict[str, float]) -> np.ndarray:
+        """Exact statevector of a team's state circuit, cached by metrics.
+        
+        Args:
+            team_metrics (Dict[str, float]): Team performance metrics
             
         Returns:
-            Dict[str, float]: Win probabilities for each team
+            np.ndarray: Read-only 32-amplitude statevector
+        """
+        return team_statevector(metric_key(team_metrics))
+    
+    def create_game_circuit(self, home_metrics: Dict[str, float],
+                            away_metrics: Dict[str, float]) -> QuantumCircuit:
+        """Create the ten-qubit circuit for a single game.
+        
+        Args:
+            home_metrics (Dict[str, float]): Home team metrics, on qubits 0-4
+            away_metrics (Dict[str, float]): Away team metrics, on qubits 5-9
+            
+        Returns:
+            QuantumCircuit: Game circuit with both teams measured
         """
         # Create circuits for both teams
         home_circuit = self.create_team_state_circuit(home_metrics)
         away_circuit = self.create_team_state_circuit(away_metrics)
         
         # Combine circuits
+        QuantumCircuit = qiskit_import('qiskit', 'QuantumCircuit')
         game_circuit = QuantumCircuit(10, 10)
-        game_circuit.compose(home_circuit, range(5), range(5))
-        game_circuit.compose(away_circuit, range(5, 10), range(5, 10))
+        game_circuit = game_circuit.compose(home_circuit, range(5), range(5))
+        game_circuit = game_circuit.compose(away_circuit, range(5, 10), range(5, 10))
         
         # Add interference between teams
         game_circuit.cz(2, 7)  # Defensive interference
         game_circuit.cz(0, 5)  # Offensive interference
         
+        return game_circuit
+    
+    def game_sampler(self, home_metrics: Dict[str, float],
+                     away_metrics: Dict[str, float]) -> Callable[[int], Dict[str, int]]:
+        """Sampler returning game circuit counts for a number of shots.
+        
+        On the NumPy backend the outcome distribution comes from the cached
+        team statevectors, so no circuit is built and Qiskit is not needed.
+        
+        Args:
+            home_metrics (Dict[str, float]): Home team metrics
+            away_metrics (Dict[str, float]): Away team metrics
+            
+        Returns:
+            Callable[[int], Dict[str, int]]: Counts for a number of shots
+        """
+        if self.backend.name == 'numpy':
+            state = game_states(
+                self.team_statevector(home_metrics)[None], self.team_statevector(away_metrics)[None]
+            )
+            probabilities = np.abs(state[0]) ** 2
+            return lambda shots: self.backend.sample(probabilities, shots)
+        
+        game_circuit = self.create_game_circuit(home_metrics, away_metrics)
+        return lambda shots: self.backend.run(game_circuit, shots)
+    
+    def simulate_game(self, home_metrics: Dict[str, float], 
+                     away_metrics: Dict[str, float], 
+                     shots: int = None) -> Dict[str, float]:
+        """Simulate a game between two teams using quantum circuits.
+        
+        Without shots the win probability is computed exactly from the
+        statevector amplitudes and cached on the quantized metrics, so
+        repeated matchups are free. With shots the game circuit is sampled
+        on the backend.
+        
+        Args:
+            home_metrics (Dict[str, float]): Home team metrics
+            away_metrics (Dict[str, float]): Away team metrics
+            shots (int, optional): Number of simulation shots. Defaults to
+                None for the exact statevector result.
+            
+        Returns:
+            Dict[str, float]: Win probabilities for each team
+        """
+        if shots is None:
+            return dict(game_probabilities(metric_key(home_metrics), metric_key(away_metrics)))
+        
         # Execute simulation
-        job = execute(game_circuit, self.backend, shots=shots)
-        result = job.result().get_counts()
-        
-        # Analyze results
-        home_wins = 0
-        total = 0
-        for outcome, count in result.items():
-            home_score = sum(int(bit) for bit in outcome[:5])
-            away_score = sum(int(bit) for bit in outcome[5:])
-            if home_score > away_score:
-                home_wins += count
-            total += count
+        result = self.game_sampler(home_metrics, away_metrics)(shots)
+        
+        home_wins = count_home_wins(result)
+        total = sum(result.values())
         
         return {
             'home_win_prob': home_wins / total,
             'away_win_prob': 1 - (home_wins / total)
         }
     
+    def sample_game(self, home_metrics: Dict[str, float],
+                    away_metrics: Dict[str, float],
+                    executor: AdaptiveShotExecutor = None) -> Dict[str, float]:
+        """Sample a game adaptively until its win probability is pinned down.
+        
+        The game is sampled on the backend in rounds; lopsided games
+        stop after a few hundred shots while close ones use more of the
+        budget.
+        
+        Args:
+            home_metrics (Dict[str, float]): Home team metrics
+            away_metrics (Dict[str, float]): Away team metrics
+            executor (AdaptiveShotExecutor, optional): Stopping rule and shot
+                budget. Defaults to AdaptiveShotExecutor().
+            
+        Returns:
+            Dict[str, float]: Win probabilities for each team, the Wilson
+                confidence_interval on home_win_prob and the shots spent
+        """
+        executor = executor or AdaptiveShotExecutor()
+        result = executor.run(self.game_sampler(home_metrics, away_metrics), count_home_wins)
+        
+        return {
+            'home_win_prob': result['success_prob'],
+            'away_win_prob': 1 - result['success_prob'],
+            'confidence_interval': result['confidence_interval'],
+            'shots': result['shots']
+        }
+    
+    def simulate_matchups(self, team_metrics: List[Dict[str, float]]) -> np.ndarray:
+        """Exact win probabilities for every pairing of a list of teams.
+        
+        Evaluates the NumPy mirror of the team state circuit for every team
+        in one vectorized statevector pass, so a full league costs one call
+        rather than a circuit per matchup. The Qiskit template is not built.
+        
+        Args:
+            team_metrics (List[Dict[str, float]]): List of team metrics
+            
+        Returns:
+            np.ndarray: Matrix whose [i, j] entry is the probability that
+                team i beats team j at home
+        """
+        metrics = np.array([[team[name] for name in TEAM_METRICS] for team in team_metrics])
+        return win_probability_matrix(metrics)
+    
+    def create_bracket_circuits(self, team_metrics: List[Dict[str, float]]) -> Dict[Tuple[int, int], QuantumCircuit]:
+        """Create one independent game circuit per opening playoff game.
+        
+        Only teams that meet are entangled, so each subcircuit is ten
+        qubits however large the field is. Later rounds are resolved
+        exactly from the matchup matrix by PlayoffBracket.
+        
+        Args:
+            team_metrics (List[Dict[str, float]]): List of team metrics in
+                seed order
+            
+        Returns:
+            Dict[Tuple[int, int], QuantumCircuit]: Game circuit for each
+                (home, away) pair of team indices
+        """
+        return {
+            (home, away): self.create_game_circuit(team_metrics[home], team_metrics[away])
+            for home, away in first_round_games(len(team_metrics))
+        }
+    
     def create_playoff_circuit(self, team_metrics: List[Dict[str, float]]) -> QuantumCircuit:
         """Create a quantum circuit for playoff simulation.
         
+        Teams are entangled along the bracket, between opening-round
+        opponents only, so the circuit has O(n) gates and separates into
+        the subcircuits of create_bracket_circuits.
+        
         Args:
-            team_metrics (List[Dict[str, float]]): List of team metrics
+            team_metrics (List[Dict[str, float]]): List of team metrics in
+                seed order
             
         Returns:
             QuantumCircuit: Quantum circuit for playoff simulation
         """
+        QuantumCircuit, QuantumRegister, ClassicalRegister = qiskit_import(
+            'qiskit', 'QuantumCircuit', 'QuantumRegister', 'ClassicalRegister'
+        )
         num_teams = len(team_metrics)
         qr_teams = [QuantumRegister(5, f'team_{i}') for i in range(num_teams)]
         cr = ClassicalRegister(5 * num_teams, 'measure')
@@ -132,24 +290,16 @@ class NFLQuantumCircuits:
         circuit = QuantumCircuit(*qr_teams, cr)
         
         # Initialize team states
+        template = self.team_state_template().remove_final_measurements(inplace=False)
         for i, metrics in enumerate(team_metrics):
-            theta_o = np.arccos(np.sqrt(metrics['offensive_power']))
-            theta_d = np.arccos(np.sqrt(metrics['defensive_power']))
-            theta_m = np.arccos(np.sqrt(metrics['momentum']))
-            
-            # Apply rotations
-            circuit.ry(theta_o, qr_teams[i][0])
-            circuit.ry(theta_d, qr_teams[i][2])
-            circuit.ry(theta_m, qr_teams[i][4])
-            
-            # Create entanglement within team
-            circuit.cx(qr_teams[i][0], qr_teams[i][1])
-            circuit.cx(qr_teams[i][2], qr_teams[i][3])
-        
-        # Create inter-team entanglement
-        for i in range(num_teams):
-            for j in range(i + 1, num_teams):
-                circuit.cz(qr_teams[i][1], qr_teams[j][3])
+            angles = metric_angles(np.array([metrics[name] for name in TEAM_METRICS]))
+            team = template.assign_parameters(dict(zip(self._team_parameters, angles.tolist())))
+            circuit.compose(team, qr_teams[i], inplace=True)
+        
+        # Entangle opening-round opponents only
+        for home, away in first_round_games(num_teams):
+            circuit.cz(qr_teams[home][2], qr_teams[away][2])  # Defensive interference
+            circuit.cz(qr_teams[home][0], qr_teams[away][0])  # Offensive interference
         
         # Measure all qubits
         for i, qr in enumerate(qr_teams):
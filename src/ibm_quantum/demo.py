@@ -9,9 +9,9 @@ import os
 import numpy as np
 import matplotlib.pyplot as plt
 from datetime import datetime
-from circuits import NFLQuantumCircuits
-from analyzer import NFLQuantumAnalyzer
-from predictor import NFLQuantumPredictor
+from src.ibm_quantum.circuits import NFLQuantumCircuits
+from src.ibm_quantum.analyzer import NFLQuantumAnalyzer
+from src.ibm_quantum.predictor import NFLQuantumPredictor
 
 # Initialize quantum components
 api_token = os.getenv('IBM_QUANTUM_TOKEN')  # Set your IBM Quantum token in environment variables
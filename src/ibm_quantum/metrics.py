@@ -0,0 +1,66 @@
+"""
+NFL Quantum State Metrics
+
+This module computes coherence and entanglement of pure states straight from
+their amplitudes, without forming density matrices. Qubit ordering is
+little-endian like Qiskit: bit k of a basis index is qubit k.
+"""
+
+from typing import Sequence
+import numpy as np
+
+# Schmidt weights below this are treated as zero
+EIGENVALUE_CUTOFF = 1e-10
+
+def l1_coherence(amplitudes: np.ndarray) -> float:
+    """l1-norm coherence of a pure state in O(2^n).
+
+    The off-diagonal sum of |psi><psi| is (sum |psi_i|)^2 - sum |psi_i|^2.
+
+    Args:
+        amplitudes (np.ndarray): Normalized statevector
+
+    Returns:
+        float: l1-norm coherence
+    """
+    magnitudes = np.abs(np.asarray(amplitudes))
+    return float(magnitudes.sum() ** 2 - np.dot(magnitudes, magnitudes))
+
+def schmidt_weights(amplitudes: np.ndarray, traced: Sequence[int]) -> np.ndarray:
+    """Eigenvalues of the reduced state left after tracing out some qubits.
+
+    The amplitudes are reshaped into a kept x traced matrix whose squared
+    singular values are the reduced state's eigenvalues, so the reduced
+    density matrix is never built.
+
+    Args:
+        amplitudes (np.ndarray): Normalized statevector
+        traced (Sequence[int]): Qubits traced out
+
+    Returns:
+        np.ndarray: Nonzero Schmidt weights
+    """
+    amplitudes = np.asarray(amplitudes)
+    num_qubits = int(np.log2(len(amplitudes)))
+
+    # Axis i of the reshaped tensor is qubit num_qubits - 1 - i
+    traced_axes = [num_qubits - 1 - qubit for qubit in traced]
+    kept_axes = [axis for axis in range(num_qubits) if axis not in traced_axes]
+    matrix = np.transpose(amplitudes.reshape((2,) * num_qubits), kept_axes + traced_axes)
+    matrix = matrix.reshape(2 ** len(kept_axes), 2 ** len(traced_axes))
+
+    weights = np.linalg.svd(matrix, compute_uv=False) ** 2
+    return weights[weights > EIGENVALUE_CUTOFF]
+
+def entanglement_entropy(amplitudes: np.ndarray, traced: Sequence[int] = (0, 1)) -> float:
+    """Von Neumann entropy, in bits, of the state left after tracing out qubits.
+
+    Args:
+        amplitudes (np.ndarray): Normalized statevector
+        traced (Sequence[int], optional): Qubits traced out. Defaults to (0, 1).
+
+    Returns:
+        float: Entanglement entropy
+    """
+    weights = schmidt_weights(amplitudes, traced)
+    return max(0.0, float(-np.sum(weights * np.log2(weights))))
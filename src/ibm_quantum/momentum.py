@@ -5,21 +5,183 @@ This module implements quantum algorithms for tracking and predicting
 team momentum throughout games and seasons.
 """
 
-from typing import Dict, List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
 import numpy as np
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
-from qiskit.algorithms import GroverOperator
-from qiskit.quantum_info import Statevector
+from .backend import qiskit_import
+from .statevector import zero_state, ry, cx, cz
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# Momentum circuit layout: plays on qubits 0-2, energy on 3-4, tempo on 5-6
+MOMENTUM_QUBITS = 7
+
+def _state_weights() -> np.ndarray:
+    """Momentum weight of every integer outcome of the momentum circuit."""
+    outcome = np.arange(2 ** MOMENTUM_QUBITS)
+    plays_value = (outcome & 7) / 7
+    energy_value = (outcome >> 3 & 3) / 3
+    tempo_value = (outcome >> 5 & 3) / 3
+    return plays_value * 0.5 + energy_value * 0.3 + tempo_value * 0.2
+
+STATE_WEIGHTS = _state_weights()
+STATE_WEIGHTS.flags.writeable = False
+
+def counts_histogram(counts: Dict[str, int]) -> np.ndarray:
+    """Measurement counts as a histogram indexed by integer outcome.
+
+    Args:
+        counts (Dict[str, int]): Momentum circuit counts
+
+    Returns:
+        np.ndarray: Counts with shape (128,)
+    """
+    outcomes = np.fromiter((int(outcome.replace(' ', ''), 2) for outcome in counts), dtype=np.int64, count=len(counts))
+    shots = np.fromiter(counts.values(), dtype=float, count=len(counts))
+    return np.bincount(outcomes, weights=shots, minlength=2 ** MOMENTUM_QUBITS)
+
+def momentum_states(angles: np.ndarray) -> np.ndarray:
+    """Statevectors of the momentum circuit for many players at once.
+
+    Args:
+        angles (np.ndarray): RY angles with shape (players, 5): the three
+            play qubits, then energy and tempo
+
+    Returns:
+        np.ndarray: Statevectors with shape (players, 128)
+    """
+    angles = np.atleast_2d(angles)
+    state = zero_state(MOMENTUM_QUBITS, len(angles))
+    for qubit in range(3):
+        state = ry(state, angles[:, qubit], qubit)
+    state = cx(ry(state, angles[:, 3], 3), 3, 4)
+    state = cx(ry(state, angles[:, 4], 5), 5, 6)
+    state = cz(state, 2, 3)
+    return cz(state, 4, 5)
+
+class MomentumHistory:
+    """Bounded, array-backed momentum history for many teams
+    
+    Each team owns one row of a fixed (max_teams, retention) ring buffer
+    plus exponentially weighted mean and variance updated in O(1) per
+    score. When every row is taken the least recently updated team is
+    evicted, so memory stays fixed however long the service runs.
+    """
+    
+    def __init__(self, retention: int = 32, max_teams: int = 256, span: int = 3):
+        if retention < 2 or max_teams < 1:
+            raise ValueError("retention must be at least 2 and max_teams at least 1")
+        self.alpha = 2 / (span + 1)
+        self.scores = np.zeros((max_teams, retention))
+        self.count = np.zeros(max_teams, dtype=np.int64)
+        self.mean = np.zeros(max_teams)
+        self.variance = np.zeros(max_teams)
+        self.last_update = np.zeros(max_teams, dtype=np.int64)
+        self.rows = {}
+        self.free_rows = list(range(max_teams - 1, -1, -1))
+        self.updates = 0
+        
+    @property
+    def retention(self) -> int:
+        return self.scores.shape[1]
+        
+    def push(self, team_id: str, score: float):
+        """Record a team's latest momentum score"""
+        row = self.rows.get(team_id)
+        if row is None:
+            row = self._allocate(team_id)
+            
+        count = self.count[row]
+        self.scores[row, count % self.retention] = score
+        if count == 0:
+            self.mean[row] = score
+        else:
+            diff = score - self.mean[row]
+            increment = self.alpha * diff
+            self.mean[row] += increment
+            self.variance[row] = (1 - self.alpha) * (self.variance[row] + diff * increment)
+        self.count[row] = count + 1
+        self.updates += 1
+        self.last_update[row] = self.updates
+        
+    def _allocate(self, team_id: str) -> int:
+        if not self.free_rows:
+            self.evict_inactive(1)
+        row = self.free_rows.pop()
+        self.count[row] = 0
+        self.mean[row] = self.variance[row] = 0.0
+        self.rows[team_id] = row
+        return row
+        
+    def evict_inactive(self, limit: int = None, idle_updates: int = None) -> List[str]:
+        """Free the rows of teams that have gone quiet.
+        
+        Args:
+            limit (int, optional): Evict at most this many teams, least
+                recently updated first. Defaults to None for no limit.
+            idle_updates (int, optional): Only evict teams with no score in
+                this many updates across all teams. Defaults to None.
+                
+        Returns:
+            List[str]: Evicted team identifiers
+        """
+        teams = sorted(self.rows, key=lambda team: self.last_update[self.rows[team]])
+        if idle_updates is not None:
+            teams = [team for team in teams if self.updates - self.last_update[self.rows[team]] >= idle_updates]
+        evicted = teams[:limit]
+        for team in evicted:
+            self.free_rows.append(self.rows.pop(team))
+        return evicted
+        
+    def recent(self, team_id: str, size: int = None) -> np.ndarray:
+        """Retained scores for a team, oldest first"""
+        row = self.rows.get(team_id)
+        if row is None:
+            return np.zeros(0)
+        filled = int(min(self.count[row], self.retention, size or self.retention))
+        slots = (self.count[row] - filled + np.arange(filled)) % self.retention
+        return self.scores[row, slots]
+        
+    def trend(self, team_id: str) -> float:
+        """Change between a team's last two scores, 0 before two scores"""
+        latest = self.recent(team_id, 2)
+        return float(latest[1] - latest[0]) if len(latest) == 2 else 0.0
+        
+    def stability(self, team_id: str) -> float:
+        """Stability from the weighted variance, 1 before three scores"""
+        row = self.rows.get(team_id)
+        if row is None or self.count[row] < 3:
+            return 1.0
+        return float(1 - min(self.variance[row] * 4, 1))  # Scale variance to 0-1 range
+        
+    def get(self, team_id: str, default=None):
+        return self.recent(team_id) if team_id in self.rows else default
+        
+    def __getitem__(self, team_id: str) -> np.ndarray:
+        if team_id not in self.rows:
+            raise KeyError(team_id)
+        return self.recent(team_id)
+        
+    def __contains__(self, team_id: str) -> bool:
+        return team_id in self.rows
+        
+    def __len__(self) -> int:
+        return len(self.rows)
 
 class NFLQuantumMomentum:
-    def __init__(self, circuits):
+    def __init__(self, circuits, retention: int = 32, max_teams: int = 256):
         """Initialize NFL Quantum Momentum Tracker.
         
         Args:
             circuits: NFLQuantumCircuits instance
+            retention (int, optional): Scores kept per team. Defaults to 32.
+            max_teams (int, optional): Teams tracked at once; the least
+                recently updated team is evicted beyond this. Defaults to 256.
         """
         self.circuits = circuits
-        self.momentum_history = {}
+        self.momentum_history = MomentumHistory(retention, max_teams)
         
     def create_momentum_circuit(self, recent_plays: List[Dict]) -> QuantumCircuit:
         """Create quantum circuit for momentum analysis.
@@ -30,6 +192,10 @@ class NFLQuantumMomentum:
         Returns:
             QuantumCircuit: Quantum circuit for momentum analysis
         """
+        QuantumCircuit, QuantumRegister, ClassicalRegister = qiskit_import(
+            'qiskit', 'QuantumCircuit', 'QuantumRegister', 'ClassicalRegister'
+        )
+        
         # Create registers for different momentum factors
         qr_plays = QuantumRegister(3, 'plays')
         qr_energy = QuantumRegister(2, 'energy')
@@ -57,11 +223,29 @@ class NFLQuantumMomentum:
         circuit.cz(qr_plays[2], qr_energy[0])
         circuit.cz(qr_energy[1], qr_tempo[0])
         
-        # Measure all qubits
-        circuit.measure_all()
+        # Measure into the declared register so outcomes index STATE_WEIGHTS
+        circuit.measure(qr_plays, cr[0:3])
+        circuit.measure(qr_energy, cr[3:5])
+        circuit.measure(qr_tempo, cr[5:7])
         
         return circuit
     
+    def _momentum_angles(self, recent_plays: List[Dict]) -> np.ndarray:
+        """RY angles of the momentum circuit, as encoded by create_momentum_circuit.
+        
+        Args:
+            recent_plays (List[Dict]): List of recent plays and their outcomes
+            
+        Returns:
+            np.ndarray: Angles for the three play qubits, energy and tempo
+        """
+        angles = np.zeros(5)
+        for i, play in enumerate(recent_plays[-3:]):
+            angles[i] = np.pi * play['success_rate']
+        angles[3] = self._calculate_energy_level(recent_plays) * np.pi
+        angles[4] = self._calculate_tempo(recent_plays) * np.pi
+        return angles
+    
     def _calculate_energy_level(self, plays: List[Dict]) -> float:
         """Calculate team energy level from recent plays.
         
@@ -113,29 +297,72 @@ class NFLQuantumMomentum:
         tempo = (40 - avg_time) / (40 - 15)
         return max(0, min(1, tempo))
     
-    def track_momentum(self, team_id: str, game_data: Dict) -> Dict[str, float]:
+    def track_momentum(self, team_id: str, game_data: Dict, shots: int = None) -> Dict[str, float]:
         """Track team momentum throughout a game.
         
+        By default the score is the exact expectation over the momentum
+        circuit's outcome distribution, matching track_momentum_batch. With
+        shots, the momentum circuit is sampled on the circuits' backend and
+        scored from the measurement counts; that estimate converges to the
+        exact score as shots grow.
+        
         Args:
             team_id (str): Team identifier
             game_data (Dict): Current game data
+            shots (int, optional): Shots to sample. Defaults to None, exact.
             
         Returns:
             Dict[str, float]: Momentum analysis results
         """
+        if shots is None:
+            return self.track_momentum_batch({team_id: game_data})[team_id]
+        
+        # Execute the momentum circuit, or sample its exact distribution
+        # on the NumPy backend
         recent_plays = game_data['recent_plays']
+        backend = self.circuits.backend
+        if backend.name == 'numpy':
+            state = momentum_states(self._momentum_angles(recent_plays))
+            counts = backend.sample(np.abs(state[0]) ** 2, shots)
+        else:
+            counts = backend.run(self.create_momentum_circuit(recent_plays), shots)
         
-        # Create and execute momentum circuit
-        circuit = self.create_momentum_circuit(recent_plays)
-        counts = self.circuits.backend.run(circuit).result().get_counts()
+        return self._record_momentum(team_id, self._analyze_momentum_counts(counts))
+    
+    def track_momentum_batch(self, game_data: Dict[str, Dict]) -> Dict[str, Dict[str, float]]:
+        """Track momentum for many players or teams in one vectorized pass.
         
-        # Analyze results
-        momentum_score = self._analyze_momentum_counts(counts)
+        Scores are exact expectations over the momentum circuit's outcome
+        distribution, so every starter on both sidelines costs one batched
+        statevector evaluation per snap rather than a backend job each.
         
-        # Store in history
-        if team_id not in self.momentum_history:
-            self.momentum_history[team_id] = []
-        self.momentum_history[team_id].append(momentum_score)
+        Args:
+            game_data (Dict[str, Dict]): Current game data keyed by
+                identifier, each with its recent_plays
+            
+        Returns:
+            Dict[str, Dict[str, float]]: Momentum analysis results by identifier
+        """
+        angles = np.array([self._momentum_angles(data['recent_plays']) for data in game_data.values()])
+        probabilities = np.abs(momentum_states(angles)) ** 2
+        scores = probabilities @ STATE_WEIGHTS
+        
+        return {
+            team_id: self._record_momentum(team_id, float(score))
+            for team_id, score in zip(game_data, scores)
+        }
+    
+    def _record_momentum(self, team_id: str, momentum_score: float) -> Dict[str, float]:
+        """Store a momentum score and summarize the team's history.
+        
+        Args:
+            team_id (str): Team identifier
+            momentum_score (float): Latest momentum score
+            
+        Returns:
+            Dict[str, float]: Momentum analysis results
+        """
+        self.momentum_history.push(team_id, momentum_score)
         
         return {
             'current_momentum': momentum_score,
@@ -152,12 +379,8 @@ class NFLQuantumMomentum:
         Returns:
             float: Momentum score between 0 and 1
         """
-        total_shots = sum(counts.values())
-        weighted_sum = sum(
-            counts[outcome] * self._calculate_state_weight(outcome)
-            for outcome in counts
-        )
-        return weighted_sum / total_shots
+        histogram = counts_histogram(counts)
+        return float(histogram @ STATE_WEIGHTS / histogram.sum())
     
     def _calculate_state_weight(self, state: str) -> float:
         """Calculate weight of a measured quantum state.
@@ -168,12 +391,7 @@ class NFLQuantumMomentum:
         Returns:
             float: State weight between 0 and 1
         """
-        # Convert binary string to momentum score
-        plays_value = int(state[:3], 2) / 7
-        energy_value = int(state[3:5], 2) / 3
-        tempo_value = int(state[5:], 2) / 3
-        
-        return (plays_value * 0.5 + energy_value * 0.3 + tempo_value * 0.2)
+        return float(STATE_WEIGHTS[int(state.replace(' ', ''), 2)])
     
     def _calculate_momentum_trend(self, team_id: str) -> float:
         """Calculate momentum trend from history.
@@ -184,25 +402,18 @@ class NFLQuantumMomentum:
         Returns:
             float: Momentum trend (-1 to 1)
         """
-        history = self.momentum_history.get(team_id, [])
-        if len(history) < 2:
-            return 0
-            
-        return history[-1] - history[-2]
+        return self.momentum_history.trend(team_id)
     
     def _calculate_stability(self, team_id: str) -> float:
         """Calculate momentum stability.
         
+        Uses the exponentially weighted variance kept by the history, so
+        no window of past scores is rescanned.
+        
         Args:
             team_id (str): Team identifier
             
         Returns:
             float: Stability score between 0 and 1
         """
-        history = self.momentum_history.get(team_id, [])
-        if len(history) < 3:
-            return 1
-            
-        # Calculate variance of recent momentum scores
-        variance = np.var(history[-3:])
-        return 1 - min(variance * 4, 1)  # Scale variance to 0-1 range
+        return self.momentum_history.stability(team_id)
@@ -5,12 +5,16 @@ This module implements quantum-based prediction models for NFL games
 using IBM Quantum computers.
 """
 
-from typing import Dict, List, Tuple
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Tuple
 import numpy as np
-from qiskit import QuantumCircuit, execute
-from qiskit.algorithms import VQE
-from qiskit.circuit.library import TwoLocal
-from qiskit.opflow import PauliSumOp
+from .backend import qiskit_import
+from .bracket import PlayoffBracket
+from .sampling import AdaptiveShotExecutor
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
 
 class NFLQuantumPredictor:
     def __init__(self, circuits, analyzer):
@@ -25,7 +29,8 @@ class NFLQuantumPredictor:
         
     def predict_game_outcome(self, home_metrics: Dict[str, float],
                            away_metrics: Dict[str, float],
-                           context_factors: Dict[str, float] = None) -> Dict[str, float]:
+                           context_factors: Dict[str, float] = None,
+                           executor: AdaptiveShotExecutor = None) -> Dict[str, float]:
         """Predict game outcome using quantum computation.
         
         Args:
@@ -33,13 +38,21 @@ class NFLQuantumPredictor:
             away_metrics (Dict[str, float]): Away team metrics
             context_factors (Dict[str, float], optional): Additional factors
                 like weather, rest days, etc.
+            executor (AdaptiveShotExecutor, optional): Sample the game circuit
+                adaptively with this executor. Defaults to None for the
+                exact statevector result, which spends no shots.
                 
         Returns:
-            Dict[str, float]: Prediction results including win probabilities
-                and confidence scores
+            Dict[str, float]: Prediction results including win probabilities,
+                confidence scores and the shots spent
         """
         # Base prediction from quantum simulation
-        base_prediction = self.circuits.simulate_game(home_metrics, away_metrics)
+        if executor is None:
+            base_prediction = self.circuits.simulate_game(home_metrics, away_metrics)
+            shots = 0
+        else:
+            base_prediction = self.circuits.sample_game(home_metrics, away_metrics, executor)
+            shots = base_prediction['shots']
         
         # Quantum state analysis
         matchup_analysis = self.analyzer.analyze_matchup(home_metrics, away_metrics)
@@ -63,7 +76,8 @@ class NFLQuantumPredictor:
             'home_win_prob': adjusted_probs['home_win_prob'],
             'away_win_prob': adjusted_probs['away_win_prob'],
             'confidence_score': confidence,
-            'quantum_factors': matchup_analysis
+            'quantum_factors': matchup_analysis,
+            'shots': shots
         }
     
     def _apply_context_factors(self, base_probs: Dict[str, float],
@@ -111,31 +125,48 @@ class NFLQuantumPredictor:
         
         return (base_confidence + prob_diff) / 2
     
+    def predict_playoff_bracket(self, team_metrics: List[Dict[str, float]]) -> Dict:
+        """Predict exact advancement odds for a playoff field.
+        
+        Every pairing is evaluated in one exact statevector pass and the
+        bracket is resolved from those probabilities, so no circuit ever
+        spans the whole field. A 14-team field uses the NFL format.
+        
+        Args:
+            team_metrics (List[Dict[str, float]]): List of team metrics in
+                seed order
+            
+        Returns:
+            Dict: first_round games, advancement matrix and champion_prob
+                as returned by PlayoffBracket.simulate
+        """
+        win_matrix = self.circuits.simulate_matchups(team_metrics)
+        return PlayoffBracket(win_matrix).simulate()
+    
     def predict_playoff_outcomes(self, team_metrics: List[Dict[str, float]]) -> List[Dict]:
         """Predict playoff tournament outcomes.
         
         Args:
-            team_metrics (List[Dict[str, float]]): List of team metrics
+            team_metrics (List[Dict[str, float]]): List of team metrics in
+                seed order
             
         Returns:
-            List[Dict]: Predicted outcomes for each matchup
+            List[Dict]: Predicted outcomes for each opening-round matchup,
+                with each team's advancement odds by round
         """
-        circuit = self.circuits.create_playoff_circuit(team_metrics)
-        
-        # Run multiple shots to get statistics
-        results = execute(circuit, self.circuits.backend, shots=1000).result()
-        counts = results.get_counts()
+        bracket = self.predict_playoff_bracket(team_metrics)
         
-        # Analyze results
         outcomes = []
-        for i in range(0, len(team_metrics)-1, 2):
+        for home, away, _ in bracket['first_round']:
             matchup = {
-                'team1': i,
-                'team2': i+1,
+                'team1': home,
+                'team2': away,
                 'prediction': self.predict_game_outcome(
-                    team_metrics[i],
-                    team_metrics[i+1]
-                )
+                    team_metrics[home],
+                    team_metrics[away]
+                ),
+                'team1_advancement': bracket['advancement'][home],
+                'team2_advancement': bracket['advancement'][away]
             }
             outcomes.append(matchup)
         
@@ -150,6 +181,8 @@ class NFLQuantumPredictor:
         Returns:
             QuantumCircuit: Trained prediction circuit
         """
+        TwoLocal = qiskit_import('qiskit.circuit.library', 'TwoLocal')
+        VQE = qiskit_import('qiskit.algorithms', 'VQE')
         num_qubits = 5  # Can be adjusted based on features
         
         # Create variational circuit
@@ -159,7 +192,7 @@ class NFLQuantumPredictor:
         hamiltonian = self._create_prediction_hamiltonian(historical_data)
         
         # Use VQE to train the circuit
-        vqe = VQE(var_form, optimizer='SPSA', quantum_instance=self.circuits.backend)
+        vqe = VQE(var_form, optimizer='SPSA', quantum_instance=self.circuits.backend.simulator)
         result = vqe.compute_minimum_eigenvalue(hamiltonian)
         
         return result.optimal_circuit
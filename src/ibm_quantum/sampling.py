@@ -0,0 +1,116 @@
+"""
+NFL Quantum Adaptive Sampling
+
+This module spends shots where the uncertainty is. Circuits are sampled in
+rounds until the Wilson interval on the success rate is narrow enough or the
+shot budget is used up, instead of always running a fixed 1000 shots.
+"""
+
+from typing import Callable, Dict, Tuple
+import numpy as np
+
+# Two-sided 95% normal quantile
+WILSON_Z = 1.96
+
+def wilson_interval(successes: int, shots: int, z: float = WILSON_Z) -> Tuple[float, float]:
+    """Wilson score interval for a binomial success rate.
+
+    Args:
+        successes (int): Number of successful shots
+        shots (int): Total number of shots
+        z (float, optional): Normal quantile. Defaults to WILSON_Z.
+
+    Returns:
+        Tuple[float, float]: Lower and upper bounds
+    """
+    if shots == 0:
+        return 0.0, 1.0
+    rate = successes / shots
+    denominator = 1 + z ** 2 / shots
+    center = (rate + z ** 2 / (2 * shots)) / denominator
+    half_width = z * np.sqrt(rate * (1 - rate) / shots + z ** 2 / (4 * shots ** 2)) / denominator
+    return float(max(0.0, center - half_width)), float(min(1.0, center + half_width))
+
+def count_home_wins(counts: Dict[str, int]) -> int:
+    """Shots in which the home team measured more ones than the away team.
+
+    Args:
+        counts (Dict[str, int]): Game circuit counts; bitstrings list clbit 9
+            first, so the home team is the last five characters
+
+    Returns:
+        int: Number of home wins
+    """
+    home_wins = 0
+    for outcome, count in counts.items():
+        if outcome[5:].count('1') > outcome[:5].count('1'):
+            home_wins += count
+    return home_wins
+
+class AdaptiveShotExecutor:
+    def __init__(self, target_width: float = 0.04, max_shots: int = 8192,
+                 round_shots: int = 256, z: float = WILSON_Z):
+        """Initialize the adaptive shot executor.
+
+        Args:
+            target_width (float, optional): Stop once the Wilson interval is
+                at most this wide. Defaults to 0.04.
+            max_shots (int, optional): Shot budget per prediction.
+                Defaults to 8192.
+            round_shots (int, optional): Shots in the first and smallest
+                round. Defaults to 256.
+            z (float, optional): Normal quantile. Defaults to WILSON_Z.
+        """
+        self.target_width = target_width
+        self.max_shots = max_shots
+        self.round_shots = round_shots
+        self.z = z
+
+    def next_round(self, successes: int, shots: int) -> int:
+        """Shots for the next round, sized to just reach the target width.
+
+        Args:
+            successes (int): Successes so far
+            shots (int): Shots so far
+
+        Returns:
+            int: Shots to run next, zero once done
+        """
+        if shots == 0:
+            return min(self.round_shots, self.max_shots)
+        lower, upper = wilson_interval(successes, shots, self.z)
+        if shots >= self.max_shots or upper - lower <= self.target_width:
+            return 0
+        rate = successes / shots
+        # Normal approximation, with a floor so decided games still converge
+        variance = max(rate * (1 - rate), 1 / shots)
+        needed = int(np.ceil(variance * (2 * self.z / self.target_width) ** 2))
+        return min(max(needed - shots, self.round_shots), self.max_shots - shots)
+
+    def run(self, sample: Callable[[int], Dict[str, int]],
+            count: Callable[[Dict[str, int]], int]) -> Dict:
+        """Sample in rounds until the interval or the budget stops it.
+
+        Args:
+            sample (Callable[[int], Dict[str, int]]): Runs the circuit for a
+                number of shots and returns its counts
+            count (Callable[[Dict[str, int]], int]): Successes in a set of
+                counts
+
+        Returns:
+            Dict: success_prob, confidence_interval, shots and rounds used
+        """
+        successes = shots = rounds = 0
+        batch = self.next_round(successes, shots)
+        while batch:
+            successes += count(sample(batch))
+            shots += batch
+            rounds += 1
+            batch = self.next_round(successes, shots)
+
+        return {
+            'success_prob': successes / shots if shots else 0.5,
+            'confidence_interval': wilson_interval(successes, shots, self.z),
+            'shots': shots,
+            'rounds': rounds
+        }
@@ -0,0 +1,150 @@
+"""
+NFL Quantum Statevector Backend
+
+This module evaluates the NFL team and game circuits exactly with NumPy,
+without sampling and without a Qiskit backend. States are little-endian like
+Qiskit: bit k of a basis index is qubit k.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+import numpy as np
+
+TEAM_METRICS = ('offensive_power', 'defensive_power', 'momentum')
+TEAM_QUBITS = 5
+
+# Metrics are rounded to this many decimals before caching
+METRIC_PRECISION = 6
+
+def metric_key(team_metrics: Dict[str, float], precision: int = METRIC_PRECISION) -> Tuple[float, ...]:
+    """Quantized, hashable key for a team's metrics.
+
+    Args:
+        team_metrics (Dict[str, float]): Team performance metrics
+        precision (int, optional): Decimals kept. Defaults to METRIC_PRECISION.
+
+    Returns:
+        Tuple[float, ...]: Rounded metric values in TEAM_METRICS order
+    """
+    return tuple(round(float(team_metrics[name]), precision) for name in TEAM_METRICS)
+
+def zero_state(num_qubits: int, batch: int = 1) -> np.ndarray:
+    """Batch of |0...0> states with shape (batch, 2**num_qubits)."""
+    state = np.zeros((batch, 2 ** num_qubits))
+    state[:, 0] = 1.0
+    return state
+
+def ry(state: np.ndarray, theta, qubit: int) -> np.ndarray:
+    """Apply RY(theta) to one qubit of every state in the batch.
+
+    Args:
+        state (np.ndarray): States with shape (batch, 2**n)
+        theta: Rotation angle, scalar or one per state
+        qubit (int): Target qubit
+
+    Returns:
+        np.ndarray: Rotated states
+    """
+    batch, size = state.shape
+    split = state.reshape(batch, size // (2 << qubit), 2, 1 << qubit)
+    half = np.reshape(np.asarray(theta, dtype=float) / 2, (-1, 1, 1))
+    cos, sin = np.cos(half), np.sin(half)
+    zero, one = split[:, :, 0], split[:, :, 1]
+    return np.stack((cos * zero - sin * one, sin * zero + cos * one), axis=2).reshape(batch, size)
+
+@lru_cache(maxsize=None)
+def _cx_permutation(num_qubits: int, control: int, target: int) -> np.ndarray:
+    index = np.arange(2 ** num_qubits)
+    return np.where(index >> control & 1, index ^ (1 << target), index)
+
+@lru_cache(maxsize=None)
+def _cz_phase(num_qubits: int, first: int, second: int) -> np.ndarray:
+    index = np.arange(2 ** num_qubits)
+    return np.where((index >> first & 1) & (index >> second & 1), -1.0, 1.0)
+
+def cx(state: np.ndarray, control: int, target: int) -> np.ndarray:
+    """Apply CNOT to every state in the batch."""
+    return state[:, _cx_permutation(int(np.log2(state.shape[1])), control, target)]
+
+def cz(state: np.ndarray, first: int, second: int) -> np.ndarray:
+    """Apply CZ to every state in the batch."""
+    return state * _cz_phase(int(np.log2(state.shape[1])), first, second)
+
+def metric_angles(metrics: np.ndarray) -> np.ndarray:
+    """RY angles encoding metric probabilities in [0, 1]."""
+    return np.arccos(np.sqrt(metrics))
+
+def team_states(metrics: np.ndarray) -> np.ndarray:
+    """Statevectors of the team state circuit for many teams at once.
+
+    Mirrors NFLQuantumCircuits.create_team_state_circuit before measurement:
+    offense on qubits 0-1, defense on 2-3, momentum on 4.
+
+    Args:
+        metrics (np.ndarray): Metrics with shape (teams, 3) in TEAM_METRICS order
+
+    Returns:
+        np.ndarray: Statevectors with shape (teams, 32)
+    """
+    angles = metric_angles(np.atleast_2d(np.asarray(metrics, dtype=float)))
+    state = zero_state(TEAM_QUBITS, len(angles))
+    state = cx(ry(state, angles[:, 0], 0), 0, 1)
+    state = cx(ry(state, angles[:, 1], 2), 2, 3)
+    state = ry(state, angles[:, 2], 4)
+    return cz(state, 1, 2)
+
+def game_states(home_states: np.ndarray, away_states: np.ndarray) -> np.ndarray:
+    """Ten-qubit game statevectors with home on qubits 0-4 and away on 5-9."""
+    state = (away_states[:, :, None] * home_states[:, None, :]).reshape(len(home_states), -1)
+    state = cz(state, 2, 7)
+    return cz(state, 0, 5)
+
+@lru_cache(maxsize=None)
+def _team_scores() -> Tuple[np.ndarray, np.ndarray]:
+    index = np.arange(2 ** (2 * TEAM_QUBITS))
+    popcount = np.array([bin(i).count('1') for i in range(2 ** TEAM_QUBITS)])
+    return popcount[index & (2 ** TEAM_QUBITS - 1)], popcount[index >> TEAM_QUBITS]
+
+def home_win_probability(states: np.ndarray) -> np.ndarray:
+    """Exact probability that the home qubits measure more ones than the away qubits."""
+    home_score, away_score = _team_scores()
+    return (np.abs(states) ** 2)[:, home_score > away_score].sum(axis=1)
+
+def win_probability_matrix(metrics: np.ndarray, block: int = 64) -> np.ndarray:
+    """Exact home-win probabilities for every ordered pair of teams.
+
+    Team states are evaluated once in a single batch, then game states are
+    built and measured a block of home teams at a time.
+
+    Args:
+        metrics (np.ndarray): Metrics with shape (teams, 3) in TEAM_METRICS order
+        block (int, optional): Home teams per vectorized pass. Defaults to 64.
+
+    Returns:
+        np.ndarray: Matrix whose [i, j] entry is P(team i beats team j at home)
+    """
+    states = team_states(metrics)
+    teams = len(states)
+    matrix = np.empty((teams, teams))
+    for start in range(0, teams, block):
+        home = states[start:start + block]
+        pairs = game_states(np.repeat(home, teams, axis=0), np.tile(states, (len(home), 1)))
+        matrix[start:start + block] = home_win_probability(pairs).reshape(len(home), teams)
+    return matrix
+
+@lru_cache(maxsize=4096)
+def team_statevector(key: Tuple[float, ...]) -> np.ndarray:
+    """Cached team statevector for a metric key; the array is read-only."""
+    state = team_states(np.array([key]))[0]
+    state.flags.writeable = False
+    return state
+
+@lru_cache(maxsize=4096)
+def game_probabilities(home_key: Tuple[float, ...], away_key: Tuple[float, ...]) -> Dict[str, float]:
+    """Cached exact win probabilities for a matchup of metric keys."""
+    state = game_states(team_statevector(home_key)[None], team_statevector(away_key)[None])
+    home_win = float(home_win_probability(state)[0])
+    return {
+        'home_win_prob': home_win,
+        'away_win_prob': 1 - home_win
+    }
@@ -1,18 +1,142 @@
 """Quantum-Enhanced Machine Learning for NFL Predictions."""
+import hashlib
+import os
+import time
+from pathlib import Path
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
 from sklearn.preprocessing import StandardScaler
 from src.quantum.state import QuantumState
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Tuple, Union
+
+# Team columns read by the feature pipeline
+TEAM_FEATURE_COLUMNS = (
+    'quantum_rating', 'entanglement_factor', 'momentum', 'wins', 'points_scored', 'points_allowed'
+)
+
+# Bump when the feature pipeline or artifact layout changes
+MODEL_VERSION = 1
+ARTIFACT_NAME = 'model.joblib'
+
+# Home, away and interference features per game
+GAME_FEATURES = 3 * 7
+
+# Games per chunk when building training features
+TRAINING_CHUNK_SIZE = 4096
+
+# Classifier settings that do not change the fitted model
+RUNTIME_PARAMS = ('n_jobs', 'verbose', 'warm_start')
+
+# A columnar table: a DataFrame, a mapping of column arrays or a structured array
+TeamTable = Union[pd.DataFrame, Mapping[str, np.ndarray], np.ndarray]
+
+def training_data_hash(X: np.ndarray, labels, params: Dict = None) -> str:
+    """Stable key for a training set and the classifier settings fitted on it.
+    
+    Args:
+        X: Feature matrix
+        labels: Training labels
+        params (Dict, optional): Classifier parameters. Defaults to None.
+        
+    Returns:
+        str: Hex digest identifying the fitted model
+    """
+    digest = hashlib.sha256(f'v{MODEL_VERSION}'.encode())
+    for array in (np.asarray(X, dtype=float), np.asarray(labels)):
+        digest.update(str(array.shape).encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    digest.update(repr(sorted((params or {}).items())).encode())
+    return digest.hexdigest()[:16]
+
+def _team_feature_columns(quantum_rating, entanglement, momentum, classical_mean) -> List:
+    """Quantum feature columns; works on scalars and on arrays of teams."""
+    return [
+        quantum_rating,
+        entanglement,
+        momentum,
+        quantum_rating * entanglement,  # Interaction term
+        momentum * classical_mean,  # Quantum-classical coupling
+        np.sin(quantum_rating * np.pi/2),  # Non-linear transformation
+        np.exp(-entanglement)  # Decay factor
+    ]
+
+def _combine_features(home_features: np.ndarray, away_features: np.ndarray) -> np.ndarray:
+    """Home, away and quantum interference features, one row per game."""
+    return np.concatenate([
+        home_features,
+        away_features,
+        home_features * away_features  # Quantum interference
+    ], axis=-1)
 
 class QuantumMLPredictor:
     """Quantum-enhanced machine learning predictor."""
     
-    def __init__(self):
-        self.quantum_state = QuantumState()
-        self.classifier = RandomForestClassifier(n_estimators=100)
+    def __init__(self, n_estimators: int = 100, n_jobs: int = None):
+        # Neutral team state until one is assigned
+        self.quantum_state = QuantumState(rating=0.5, entanglement=0.5, momentum=0.5)
+        self.n_estimators = n_estimators  # Forest size for full training; update adds to it
+        self.classifier = RandomForestClassifier(n_estimators=n_estimators, n_jobs=n_jobs)
         self.scaler = StandardScaler()
+        self.training_hash = None
+    
+    @classmethod
+    def from_artifact(cls, path) -> 'QuantumMLPredictor':
+        """Predictor ready to serve from a saved model artifact."""
+        predictor = cls()
+        predictor.load_model(path)
+        return predictor
+    
+    @staticmethod
+    def artifact_path(cache_dir, training_hash: str) -> Path:
+        """Versioned location of the artifact for a training set."""
+        return Path(cache_dir) / f'v{MODEL_VERSION}' / training_hash / ARTIFACT_NAME
+    
+    def save_model(self, path) -> Path:
+        """Save the fitted scaler and classifier.
+        
+        The file is written next to its destination and moved into place,
+        so concurrent workers never read a partial artifact.
+        
+        Args:
+            path: Artifact file path
+            
+        Returns:
+            Path: The saved artifact
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f'.{path.name}.{os.getpid()}')
+        joblib.dump({
+            'version': MODEL_VERSION,
+            'training_hash': self.training_hash,
+            'scaler': self.scaler,
+            'classifier': self.classifier
+        }, partial)
+        os.replace(partial, path)
+        return path
+    
+    def load_model(self, path, mmap_mode: str = None) -> None:
+        """Load a saved scaler and classifier.
+        
+        joblib can only memory-map plain numpy attributes, such as the
+        scaler statistics and class labels. The fitted trees are rebuilt
+        from the file, so each process holds its own copy of the forest
+        whatever the mode.
+        
+        Args:
+            path: Artifact file path
+            mmap_mode (str, optional): joblib memory-map mode for the plain
+                array attributes. Defaults to None, reading into memory.
+        """
+        artifact = joblib.load(path, mmap_mode=mmap_mode)
+        if artifact.get('version') != MODEL_VERSION:
+            raise ValueError(f"model artifact version {artifact.get('version')} does not match {MODEL_VERSION}")
+        self.scaler = artifact['scaler']
+        self.classifier = artifact['classifier']
+        self.training_hash = artifact['training_hash']
         
     def prepare_quantum_features(self, team_data: Dict) -> np.ndarray:
         """Prepare quantum-enhanced features."""
@@ -31,40 +155,169 @@ class QuantumMLPredictor:
         ])
         
         # Quantum feature engineering
-        quantum_features.extend([
-            quantum_rating,
-            entanglement,
-            momentum,
-            quantum_rating * entanglement,  # Interaction term
-            momentum * np.mean(classical_stats),  # Quantum-classical coupling
-            np.sin(quantum_rating * np.pi/2),  # Non-linear transformation
-            np.exp(-entanglement)  # Decay factor
-        ])
+        quantum_features.extend(_team_feature_columns(
+            quantum_rating, entanglement, momentum, np.mean(classical_stats)
+        ))
         
         return np.array(quantum_features)
     
+    def quantum_features_batch(self, teams: TeamTable) -> np.ndarray:
+        """Quantum-enhanced features for a whole table of teams at once.
+        
+        Args:
+            teams: DataFrame, mapping of column arrays or structured array
+                with the TEAM_FEATURE_COLUMNS
+                
+        Returns:
+            np.ndarray: Features with one row per team
+        """
+        columns = {}
+        for name in TEAM_FEATURE_COLUMNS:
+            try:
+                columns[name] = np.asarray(teams[name], dtype=float)
+            except (KeyError, ValueError, IndexError) as error:
+                raise ValueError(f"team table is missing column '{name}'") from error
+        
+        classical_mean = (columns['wins'] + columns['points_scored'] + columns['points_allowed']) / 3
+        return np.column_stack(_team_feature_columns(
+            columns['quantum_rating'], columns['entanglement_factor'], columns['momentum'], classical_mean
+        ))
+    
+    def prepare_features_batch(self, home_teams: TeamTable, away_teams: TeamTable) -> np.ndarray:
+        """Game feature matrix for columnar home and away team tables.
+        
+        Row i of the result matches what train and predict_game build for
+        game i, without a Python loop over games.
+        
+        Args:
+            home_teams: Home team table, one row per game
+            away_teams: Away team table, one row per game
+            
+        Returns:
+            np.ndarray: Feature matrix with one row per game
+        """
+        home_features = self.quantum_features_batch(home_teams)
+        away_features = self.quantum_features_batch(away_teams)
+        if len(home_features) != len(away_features):
+            raise ValueError("home and away tables must have the same number of games")
+        return _combine_features(home_features, away_features)
+    
+    def build_training_matrix(self, training_data: List[Dict],
+                              chunk_size: int = TRAINING_CHUNK_SIZE) -> np.ndarray:
+        """Feature matrix for a list of games, built a chunk at a time.
+        
+        Each chunk is turned into columnar home and away tables and run
+        through prepare_features_batch, so only one chunk of team columns
+        is alive at once.
+        """
+        X = np.empty((len(training_data), GAME_FEATURES))
+        for start in range(0, len(training_data), chunk_size):
+            chunk = training_data[start:start + chunk_size]
+            tables = [
+                {name: [game[side][name] for game in chunk] for name in TEAM_FEATURE_COLUMNS}
+                for side in ('home_team', 'away_team')
+            ]
+            X[start:start + len(chunk)] = self.prepare_features_batch(*tables)
+        return X
+    
+    def _model_params(self) -> Dict:
+        return {
+            name: value for name, value in self.classifier.get_params().items()
+            if name not in RUNTIME_PARAMS
+        }
+    
+    def evaluate(self, games: List[Dict], labels: List[int]) -> float:
+        """Accuracy of the current model on labelled games."""
+        X_scaled = self.scaler.transform(self.build_training_matrix(games))
+        return float(accuracy_score(labels, self.classifier.predict(X_scaled)))
+    
     def train(self, 
              training_data: List[Dict], 
-             labels: List[int]) -> None:
-        """Train the quantum-enhanced model."""
-        X = []
-        for game in training_data:
-            home_features = self.prepare_quantum_features(game['home_team'])
-            away_features = self.prepare_quantum_features(game['away_team'])
-            
-            # Combine features with quantum interference
-            combined_features = np.concatenate([
-                home_features,
-                away_features,
-                home_features * away_features  # Quantum interference
-            ])
+             labels: List[int],
+             cache_dir=None,
+             validation: Tuple[List[Dict], List[int]] = None) -> Dict:
+        """Train the quantum-enhanced model.
+        
+        Trees are fitted on the classifier's n_jobs cores. With a cache_dir
+        the fitted model is stored under a key hashed from the features,
+        labels and classifier settings, and an identical training set later
+        loads that artifact instead of refitting.
+        
+        Returns:
+            Dict: Training report with mode, games, trees, seconds and the
+                accuracy on the validation games when given
+        """
+        start = time.perf_counter()
+        X = self.build_training_matrix(training_data)
+        # Undo any trees added by update, so the cache key and forest match a fresh fit
+        self.classifier.set_params(n_estimators=self.n_estimators, warm_start=False)
+        self.training_hash = training_data_hash(X, labels, self._model_params())
+        mode = 'full'
+        
+        path = None if cache_dir is None else self.artifact_path(cache_dir, self.training_hash)
+        if path is not None and path.exists():
+            self.load_model(path)
+            mode = 'cached'
+        else:
+            X_scaled = self.scaler.fit_transform(X)
+            self.classifier.fit(X_scaled, labels)
             
-            X.append(combined_features)
+            if path is not None:
+                self.save_model(path)
+        
+        return self._training_report(mode, len(X), start, validation)
+    
+    def update(self, new_games: List[Dict], new_labels: List[int],
+               new_trees: int = 10,
+               validation: Tuple[List[Dict], List[int]] = None) -> Dict:
+        """Retrain incrementally by adding trees fitted on new games only.
+        
+        The scaler stays as fitted so existing trees keep seeing the same
+        feature scale; new_trees trees are grown on the new games with
+        warm_start and join the forest.
+        
+        Args:
+            new_games (List[Dict]): Newly completed games
+            new_labels (List[int]): Their results
+            new_trees (int, optional): Trees to add. Defaults to 10.
+            validation (optional): (games, labels) to report accuracy on
             
-        X = np.array(X)
-        X_scaled = self.scaler.fit_transform(X)
+        Returns:
+            Dict: Training report as for train, plus holdout_accuracy, the
+                accuracy of the model before the update on the new games
+        """
+        if not hasattr(self.classifier, 'estimators_'):
+            raise ValueError("update requires a trained model")
+        if not np.array_equal(np.unique(new_labels), self.classifier.classes_):
+            raise ValueError("new games must include every result class the model was trained on")
         
-        self.classifier.fit(X_scaled, labels)
+        start = time.perf_counter()
+        X = self.build_training_matrix(new_games)
+        X_scaled = self.scaler.transform(X)
+        holdout_accuracy = float(accuracy_score(new_labels, self.classifier.predict(X_scaled)))
+        
+        self.classifier.set_params(
+            warm_start=True, n_estimators=len(self.classifier.estimators_) + new_trees
+        )
+        self.classifier.fit(X_scaled, new_labels)
+        self.training_hash = training_data_hash(
+            X, new_labels, {**self._model_params(), 'base': self.training_hash}
+        )
+        
+        report = self._training_report('incremental', len(X), start, validation)
+        report['holdout_accuracy'] = holdout_accuracy
+        return report
+    
+    def _training_report(self, mode: str, games: int, start: float,
+                         validation: Tuple[List[Dict], List[int]] = None) -> Dict:
+        seconds = time.perf_counter() - start
+        return {
+            'mode': mode,
+            'games': games,
+            'trees': len(self.classifier.estimators_),
+            'seconds': seconds,
+            'accuracy': None if validation is None else self.evaluate(*validation)
+        }
     
     def predict_game(self, 
                     home_team: Dict, 
@@ -74,11 +327,7 @@ class QuantumMLPredictor:
         home_features = self.prepare_quantum_features(home_team)
         away_features = self.prepare_quantum_features(away_team)
         
-        combined_features = np.concatenate([
-            home_features,
-            away_features,
-            home_features * away_features
-        ]).reshape(1, -1)
+        combined_features = _combine_features(home_features, away_features).reshape(1, -1)
         
         X_scaled = self.scaler.transform(combined_features)
         
@@ -102,6 +351,22 @@ class QuantumMLPredictor:
                 (1 - win_prob) * np.log2(1 - win_prob)
         }
     
+    def predict_games_batch(self, home_teams: TeamTable, away_teams: TeamTable) -> np.ndarray:
+        """Predict home win probabilities for many games in one pass.
+        
+        A week's slate or a large scenario sweep is scaled and scored with a
+        single transform and a single predict_proba call.
+        
+        Args:
+            home_teams: Home team table, one row per game
+            away_teams: Away team table, one row per game
+            
+        Returns:
+            np.ndarray: Home win probability for each game
+        """
+        X_scaled = self.scaler.transform(self.prepare_features_batch(home_teams, away_teams))
+        return self.classifier.predict_proba(X_scaled)[:, 1]
+    
     def analyze_quantum_impact(self, 
                              game_data: Dict) -> Dict:
         """Analyze quantum effects on prediction."""
@@ -0,0 +1,78 @@
+"""League-wide interference and entanglement matrices."""
+from typing import Dict, List, Tuple
+import numpy as np
+from src.quantum.state import QuantumState, QuantumStateBatch
+
+def _read_only(matrix: np.ndarray) -> np.ndarray:
+    view = matrix.view()
+    view.flags.writeable = False
+    return view
+
+class LeagueMatrix:
+    """Cached all-pairs interference and entanglement for a league.
+    
+    Both matrices are computed on first use and kept. A change to one
+    team's state refreshes only that team's row and column, so a
+    dashboard re-render after a single update costs O(N) instead of N^2
+    pairwise calls.
+    """
+    
+    def __init__(self, states: Dict[str, QuantumState]):
+        self.teams: List[str] = list(states)
+        self.index = {team: i for i, team in enumerate(self.teams)}
+        self.states = QuantumStateBatch.from_states(states.values())
+        self._interference = None
+        self._entanglement = None
+        
+    def _slot(self, team: str) -> int:
+        try:
+            return self.index[team]
+        except KeyError:
+            raise ValueError(f"unknown team '{team}'") from None
+        
+    def interference(self) -> np.ndarray:
+        """Read-only N x N interference matrix, in self.teams order."""
+        if self._interference is None:
+            self._interference = self.states.interfere()
+        return _read_only(self._interference)
+        
+    def entanglement(self) -> np.ndarray:
+        """Read-only N x N entanglement matrix, in self.teams order."""
+        if self._entanglement is None:
+            self._entanglement = self.states.entangle()
+        return _read_only(self._entanglement)
+        
+    def update_team(self, team: str, state: QuantumState):
+        """Replace one team's state and refresh its row and column."""
+        i = self._slot(team)
+        self.states.data[i] = state.to_vector()
+        
+        if self._interference is not None:
+            row = self.states.interfere_row(i)
+            self._interference[i, :] = row
+            self._interference[:, i] = row
+        if self._entanglement is not None:
+            row = self.states.entangle_row(i)
+            self._entanglement[i, :] = row
+            self._entanglement[:, i] = row
+            
+    def most_entangled(self, team: str, k: int = 5) -> List[Tuple[str, float]]:
+        """The k opponents most entangled with a team, strongest first.
+        
+        Args:
+            team (str): Team identifier
+            k (int, optional): Number of opponents. Defaults to 5.
+            
+        Returns:
+            List[Tuple[str, float]]: (opponent, entanglement) pairs
+        """
+        i = self._slot(team)
+        strength = self.entanglement()[i].copy()
+        strength[i] = -np.inf
+        
+        k = min(k, len(self.teams) - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(strength, -k)[-k:]
+        top = top[np.argsort(strength[top])[::-1]]
+        return [(self.teams[j], float(strength[j])) for j in top]
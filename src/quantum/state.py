@@ -84,3 +84,124 @@ class QuantumState:
             momentum=float(data["momentum"]),
             uncertainty=float(data.get("uncertainty", 0.1))
         )
+
+# Column order of QuantumStateBatch.data, matching QuantumState.to_vector
+STATE_COLUMNS = ("rating", "entanglement", "momentum", "uncertainty")
+
+def _column(index: int) -> property:
+    """Float property reading and writing one column of a batch row."""
+    def get(self) -> float:
+        return float(self._row[index])
+        
+    def set(self, value: float):
+        self._row[index] = value
+        
+    return property(get, set)
+
+class QuantumStateView(QuantumState):
+    """QuantumState backed by one row of a QuantumStateBatch.
+    
+    Reads and writes go straight to the batch array, so no data is copied.
+    """
+    rating = _column(0)
+    entanglement = _column(1)
+    momentum = _column(2)
+    uncertainty = _column(3)
+    
+    def __init__(self, row: np.ndarray):
+        self._row = row
+
+class QuantumStateBatch:
+    """Structure-of-arrays quantum states for many teams.
+    
+    Holds an N x 4 float array with one QuantumState per row, in
+    STATE_COLUMNS order. Every operation works on all teams at once.
+    """
+    
+    def __init__(self, data: np.ndarray, rng: np.random.Generator = None):
+        data = np.array(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != len(STATE_COLUMNS):
+            raise ValueError(f"data must have shape (teams, {len(STATE_COLUMNS)})")
+        self.data = data
+        self.rng = rng or np.random.default_rng()
+        
+    @classmethod
+    def from_states(cls, states, rng: np.random.Generator = None) -> 'QuantumStateBatch':
+        """Pack individual states into a batch."""
+        return cls(np.array([state.to_vector() for state in states]).reshape(-1, len(STATE_COLUMNS)), rng)
+        
+    @property
+    def rating(self) -> np.ndarray:
+        return self.data[:, 0]
+        
+    @property
+    def entanglement(self) -> np.ndarray:
+        return self.data[:, 1]
+        
+    @property
+    def momentum(self) -> np.ndarray:
+        return self.data[:, 2]
+        
+    @property
+    def uncertainty(self) -> np.ndarray:
+        return self.data[:, 3]
+        
+    def __len__(self) -> int:
+        return len(self.data)
+        
+    def __getitem__(self, index: int) -> QuantumStateView:
+        """Zero-copy view of one team's state."""
+        return QuantumStateView(self.data[index])
+        
+    def __iter__(self):
+        for row in self.data:
+            yield QuantumStateView(row)
+            
+    def evolve(self, delta_t: float = 1.0, inplace: bool = False) -> 'QuantumStateBatch':
+        """Evolve every state over time, as QuantumState.evolve does per team.
+        
+        With inplace the batch array is updated in place, so a long
+        simulation allocates only the noise draw per step.
+        """
+        noise = self.rng.standard_normal(self.data.shape)
+        noise *= self.uncertainty[:, None] * delta_t
+        if inplace:
+            self.data += noise
+            np.clip(self.data, 0, 1, out=self.data)
+            return self
+        noise += self.data
+        return QuantumStateBatch(np.clip(noise, 0, 1, out=noise), self.rng)
+        
+    def collapse(self) -> np.ndarray:
+        """Collapse every state to a classical probability."""
+        prob = (self.rating * 0.4 + self.entanglement * 0.3 + self.momentum * 0.3) / 3
+        
+        # Add quantum uncertainty
+        prob += self.rng.standard_normal(len(self)) * self.uncertainty
+        
+        return np.clip(prob, 0, 1)
+        
+    def interfere(self) -> np.ndarray:
+        """Interference of every pair of states, as a normalized Gram matrix."""
+        norms = np.linalg.norm(self.data, axis=1)
+        gram = np.abs(self.data @ self.data.T)
+        return gram / np.outer(norms, norms)
+        
+    def interfere_row(self, index: int) -> np.ndarray:
+        """Interference of one state with every state in the batch."""
+        norms = np.linalg.norm(self.data, axis=1)
+        return np.abs(self.data @ self.data[index]) / (norms * norms[index])
+        
+    def entangle(self) -> np.ndarray:
+        """Entanglement strength of every pair of states."""
+        phase = np.cos(np.pi * (self.rating[:, None] - self.rating[None, :]))
+        return np.abs(np.outer(self.entanglement, self.entanglement) * phase)
+        
+    def entangle_row(self, index: int) -> np.ndarray:
+        """Entanglement strength of one state with every state in the batch."""
+        phase = np.cos(np.pi * (self.rating - self.rating[index]))
+        return np.abs(self.entanglement * self.entanglement[index] * phase)
+        
+    def to_states(self) -> list:
+        """Zero-copy views of every team's state."""
+        return list(self)
@@ -0,0 +1,3 @@
+"""
+Game simulation package for NFL
+"""
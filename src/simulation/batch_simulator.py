@@ -0,0 +1,436 @@
+"""
+NFL Quantum Batch Game Simulator
+Advances many independent games in lockstep using NumPy arrays
+"""
+
+import numpy as np
+from dataclasses import dataclass, fields
+from typing import Dict
+from .game_simulator import (
+    SITUATION_FACTORS, PLAY_TYPE_CODES, PLAY_CLOCK, ANALYSIS_LEVELS,
+    NFLQuantumSimulator, QuantumMemory, GameSnapshot
+)
+
+# Situation codes used by the batch engine, indexing SITUATION_FACTOR_TABLE
+SITUATIONS = ('normal', 'redzone', 'thirddown', 'fourthdown', 'twominute')
+SITUATION_FACTOR_TABLE = np.array([SITUATION_FACTORS[s] for s in SITUATIONS])
+
+RUN = PLAY_TYPE_CODES["Run"]
+BREAKAWAY_RUN = PLAY_TYPE_CODES["Breakaway run"]
+FUMBLE = PLAY_TYPE_CODES["Fumble"]
+PASS_COMPLETE = PLAY_TYPE_CODES["Pass complete"]
+DEEP_PASS = PLAY_TYPE_CODES["Deep pass complete"]
+INCOMPLETE_PASS = PLAY_TYPE_CODES["Incomplete pass"]
+INTERCEPTION = PLAY_TYPE_CODES["Interception"]
+PUNT = PLAY_TYPE_CODES["Punt"]
+PUNT_RETURN = PLAY_TYPE_CODES["Punt and return"]
+FIELD_GOAL = PLAY_TYPE_CODES["Field goal"]
+MISSED_FIELD_GOAL = PLAY_TYPE_CODES["Missed field goal"]
+NO_PLAY = PLAY_TYPE_CODES["No play"]
+TOUCHDOWN = PLAY_TYPE_CODES["Touchdown"]
+TURNOVER_ON_DOWNS = PLAY_TYPE_CODES["Turnover on downs"]
+
+# Play-code lookups: plays that keep the ball at the line of scrimmage, and punts
+SCRIMMAGE_PLAYS = np.isin(
+    np.arange(len(PLAY_TYPE_CODES)),
+    [RUN, BREAKAWAY_RUN, PASS_COMPLETE, DEEP_PASS, INCOMPLETE_PASS, NO_PLAY]
+)
+PUNT_PLAYS = np.isin(np.arange(len(PLAY_TYPE_CODES)), [PUNT, PUNT_RETURN])
+
+# Possession codes
+HOME, AWAY = 0, 1
+
+@dataclass
+class BatchGameState:
+    """Structure-of-arrays state for N independent games"""
+    home_score: np.ndarray
+    away_score: np.ndarray
+    quarter: np.ndarray
+    time_remaining: np.ndarray
+    possession: np.ndarray
+    field_position: np.ndarray
+    down: np.ndarray
+    yards_to_go: np.ndarray
+    momentum: np.ndarray
+    home_quantum: np.ndarray
+    memory: QuantumMemory
+    total_plays: np.ndarray
+    # Running momentum sums, only tracked when quantum analysis is requested
+    momentum_sum: np.ndarray = None
+    momentum_sq_sum: np.ndarray = None
+    momentum_path: np.ndarray = None
+
+    @classmethod
+    def initialize(cls, n: int, rng: np.random.Generator, memory_window: int = 3,
+                   track_momentum: bool = False) -> 'BatchGameState':
+        """Create N fresh games with quantum coin tosses"""
+        home_quantum = rng.random(n)
+        superposition = rng.random(n) + home_quantum
+
+        return cls(
+            home_score=np.zeros(n, dtype=np.int32),
+            away_score=np.zeros(n, dtype=np.int32),
+            quarter=np.ones(n, dtype=np.int32),
+            time_remaining=np.full(n, 900, dtype=np.int32),
+            possession=np.where(superposition > 1, HOME, AWAY).astype(np.int8),
+            field_position=np.full(n, 20, dtype=np.int32),
+            down=np.ones(n, dtype=np.int32),
+            yards_to_go=np.full(n, 10, dtype=np.int32),
+            momentum=np.full(n, 0.5),
+            home_quantum=home_quantum,
+            memory=QuantumMemory(memory_window, memory_window, games=n),
+            total_plays=np.zeros(n, dtype=np.int32),
+            momentum_sum=np.zeros(n) if track_momentum else None,
+            momentum_sq_sum=np.zeros(n) if track_momentum else None,
+            momentum_path=np.zeros(n) if track_momentum else None
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, n: int, memory_window: int = 3,
+                      track_momentum: bool = False) -> 'BatchGameState':
+        """N copies of a live game, sharing no play history
+
+        The away team's quantum state is taken as the complement of the home
+        team's, as initialize_game sets it.
+        """
+        home_quantum = snapshot.quantum_states.get(snapshot.home_team, 0.5)
+        memory = QuantumMemory(memory_window, memory_window, games=n)
+        for success in snapshot.quantum_memory.recent_success()[-memory_window:]:
+            memory.push(np.full(n, success))
+
+        return cls(
+            home_score=np.full(n, snapshot.home_score, dtype=np.int32),
+            away_score=np.full(n, snapshot.away_score, dtype=np.int32),
+            quarter=np.full(n, snapshot.quarter, dtype=np.int32),
+            time_remaining=np.full(n, snapshot.time_remaining, dtype=np.int32),
+            possession=np.full(n, HOME if snapshot.possession == snapshot.home_team else AWAY, dtype=np.int8),
+            field_position=np.full(n, snapshot.field_position, dtype=np.int32),
+            down=np.full(n, snapshot.down, dtype=np.int32),
+            yards_to_go=np.full(n, snapshot.yards_to_go, dtype=np.int32),
+            momentum=np.full(n, snapshot.momentum),
+            home_quantum=np.full(n, home_quantum),
+            memory=memory,
+            total_plays=np.zeros(n, dtype=np.int32),
+            momentum_sum=np.zeros(n) if track_momentum else None,
+            momentum_sq_sum=np.zeros(n) if track_momentum else None,
+            momentum_path=np.zeros(n) if track_momentum else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.home_score)
+
+    @property
+    def active(self) -> np.ndarray:
+        """Mask of games that are still being played"""
+        return (self.quarter <= 4) & (self.time_remaining > 0)
+
+    def take(self, index: np.ndarray) -> 'BatchGameState':
+        """Gather a subset of games into a new batch"""
+        return BatchGameState(**{
+            f.name: getattr(self, f.name)[index]
+            for f in fields(self) if getattr(self, f.name) is not None
+        })
+
+    def put(self, index: np.ndarray, other: 'BatchGameState'):
+        """Scatter a subset batch back into this one"""
+        for f in fields(self):
+            if getattr(self, f.name) is not None:
+                getattr(self, f.name)[index] = getattr(other, f.name)
+
+class BatchGameSimulator:
+    """Vectorized counterpart of NFLQuantumSimulator.simulate_game"""
+
+    def __init__(self, simulator: NFLQuantumSimulator = None):
+        self.simulator = simulator or NFLQuantumSimulator()
+        self.rng = self.simulator.rng
+
+    def simulate(self, n: int, analysis: str = 'none', state: BatchGameState = None) -> BatchGameState:
+        """Play N games to completion and return their final states
+
+        A prepared state, such as BatchGameState.from_snapshot, continues
+        those games instead of starting fresh ones.
+        """
+        if analysis not in ANALYSIS_LEVELS:
+            raise ValueError(f"analysis must be one of {ANALYSIS_LEVELS}")
+        if state is None:
+            state = BatchGameState.initialize(
+                n, self.rng, self.simulator.memory_window, track_momentum=analysis != 'none'
+            )
+
+        active = np.flatnonzero(state.active)
+        games = state.take(active)
+        while len(games):
+            self.simulate_play(games)
+
+            # Retire finished games, compacting the batch only when it shrinks
+            playing = games.active
+            if not playing.all():
+                state.put(active[~playing], games.take(~playing))
+                active = active[playing]
+                games = games.take(playing)
+
+        return state
+
+    def get_game_situation(self, state: BatchGameState) -> np.ndarray:
+        """Situation code per game, mirroring get_game_situation"""
+        return np.select(
+            [
+                state.field_position >= 80,
+                state.down == 3,
+                state.down == 4,
+                (state.quarter >= 4) & (state.time_remaining <= 120)
+            ],
+            [1, 2, 3, 4],
+            default=0
+        )
+
+    def quantum_offset(self, state: BatchGameState) -> np.ndarray:
+        """Team quantum state plus entanglement terms shared by every draw of a play"""
+        team_quantum = np.where(state.possession == HOME, state.home_quantum, 1 - state.home_quantum)
+
+        return (team_quantum - 0.5) + (state.memory.entanglement() - 0.5)
+
+    def calculate_quantum_probability(self, base_prob, offset: np.ndarray, scale: np.ndarray) -> np.ndarray:
+        """Vectorized calculate_quantum_probability for the team in possession"""
+        quantum_noise = (self.rng.random(len(offset)) - 0.5) * 0.2
+        prob = (base_prob + quantum_noise + offset) * scale
+
+        return np.minimum(np.maximum(prob, 0, out=prob), 1, out=prob)
+
+    def calculate_play_outcome(self, state: BatchGameState):
+        """Draw one play for every game, returning play-type codes and yards"""
+        n = len(state)
+        offset = self.quantum_offset(state)
+        scale = SITUATION_FACTOR_TABLE[self.get_game_situation(state)] * self.simulator.weather_impact
+
+        run_prob = self.calculate_quantum_probability(0.4, offset, scale)
+        pass_prob = self.calculate_quantum_probability(0.5, offset, scale)
+        play_random = self.rng.random(n)
+        is_run = play_random < run_prob
+        is_pass = ~is_run & (play_random < run_prob + pass_prob)
+
+        # Each branch only draws for the games that take it
+        plays = np.full(n, NO_PLAY, dtype=np.int8)
+        yards = np.zeros(n, dtype=np.int32)
+        branches = (
+            (is_run, self._simulate_run),
+            (is_pass, self._simulate_pass),
+            (~is_run & ~is_pass & (state.down == 4), self._simulate_special_teams)
+        )
+        for mask, simulate in branches:
+            games = np.flatnonzero(mask)
+            if games.size:
+                plays[games], yards[games] = simulate(state, games, offset[games], scale[games])
+
+        return plays, yards
+
+    def _simulate_run(self, state: BatchGameState, games: np.ndarray, offset: np.ndarray, scale: np.ndarray):
+        """Running plays for the selected games"""
+        n = len(games)
+        momentum_boost = state.momentum[games] * 2 - 1
+
+        base_yards = self.rng.normal(4, 2, n)
+        quantum_factor = self.calculate_quantum_probability(0.5, offset, scale)
+        yards = np.trunc(base_yards * (1 + quantum_factor + momentum_boost))
+
+        special = self.rng.random(n) < self.calculate_quantum_probability(0.1, offset, scale)
+        breakaway = special & (yards > 0)
+        plays = np.where(breakaway, BREAKAWAY_RUN, np.where(special, FUMBLE, RUN))
+
+        return plays, np.where(breakaway, yards * 2, yards)
+
+    def _simulate_pass(self, state: BatchGameState, games: np.ndarray, offset: np.ndarray, scale: np.ndarray):
+        """Passing plays for the selected games"""
+        n = len(games)
+        incomplete = self.rng.random(n) > self.calculate_quantum_probability(0.65, offset, scale)
+        plays = np.full(n, PASS_COMPLETE, dtype=np.int8)
+        yards = np.zeros(n)
+
+        # Interceptions are only drawn for incomplete passes, yards for completions
+        missed = np.flatnonzero(incomplete)
+        intercepted = self.rng.random(missed.size) < self.calculate_quantum_probability(
+            0.15, offset[missed], scale[missed]
+        )
+        plays[missed] = np.where(intercepted, INTERCEPTION, INCOMPLETE_PASS)
+
+        caught = np.flatnonzero(~incomplete)
+        momentum_boost = state.momentum[games[caught]] * 2 - 1
+        base_yards = self.rng.normal(8, 4, caught.size)
+        quantum_factor = self.calculate_quantum_probability(0.5, offset[caught], scale[caught])
+        yards[caught] = np.trunc(base_yards * (1 + quantum_factor + momentum_boost))
+        plays[caught[yards[caught] > 30]] = DEEP_PASS
+
+        return plays, yards
+
+    def _simulate_special_teams(self, state: BatchGameState, games: np.ndarray, offset: np.ndarray,
+                                scale: np.ndarray):
+        """Fourth-down punts and field goal attempts for the selected games"""
+        n = len(games)
+        field_position = state.field_position[games]
+        punting = field_position < 65
+
+        base_distance = self.rng.normal(40, 5, n)
+        quantum_factor = self.calculate_quantum_probability(0.5, offset, scale)
+        distance = np.trunc(base_distance * (1 + quantum_factor))
+        returned = self.rng.random(n) < self.calculate_quantum_probability(0.2, offset, scale)
+        return_yards = np.trunc(self.rng.normal(10, 5, n))
+        punt_yards = np.where(returned, -(distance - return_yards), -distance)
+
+        kick_distance = 100 - field_position + 17
+        success_prob = self.calculate_quantum_probability(1 - (kick_distance - 20) / 50, offset, scale)
+        kick_good = self.rng.random(n) < success_prob
+
+        plays = np.where(
+            punting,
+            np.where(returned, PUNT_RETURN, PUNT),
+            np.where(kick_good, FIELD_GOAL, MISSED_FIELD_GOAL)
+        )
+        return plays, np.where(punting, punt_yards, np.where(kick_good, 3, 0))
+
+    def update_game_state(self, state: BatchGameState, plays: np.ndarray, yards: np.ndarray) -> np.ndarray:
+        """Vectorized update_game_state, returning the resolved play codes"""
+        field_position = state.field_position
+
+        # Scrimmage plays move the ball and the chains
+        advanced = field_position + yards
+        scrimmage = SCRIMMAGE_PLAYS[plays]
+        touchdown = scrimmage & (advanced >= 100)
+        moved = scrimmage & ~touchdown
+        first_down = yards >= state.yards_to_go
+        down = state.down + 1
+        down[first_down] = 1
+        on_downs = moved & (down > 4)
+
+        # Everything else hands the ball over; only those games are resolved here
+        new_position = np.maximum(advanced, 1)
+        turnover = ~moved
+        over = np.flatnonzero(turnover)
+        if over.size:
+            over_plays = plays[over]
+            over_position = field_position[over]
+            landing = over_position - yards[over]
+            new_position[over] = np.where(
+                touchdown[over] | (over_plays == FIELD_GOAL), 20,
+                np.where(
+                    over_plays == FUMBLE, np.clip(100 - advanced[over], 1, 99),
+                    np.where(
+                        PUNT_PLAYS[over_plays], np.where(landing >= 100, 20, np.maximum(100 - landing, 1)),
+                        100 - over_position
+                    )
+                )
+            )
+        new_position[on_downs] = 100 - new_position[on_downs]
+        turnover |= on_downs
+
+        points = np.where(plays == FIELD_GOAL, 3, 0)
+        points[touchdown] = 7
+        home = state.possession == HOME
+        state.home_score += np.where(home, points, 0)
+        state.away_score += np.where(home, 0, points)
+
+        state.field_position = new_position
+        down[turnover] = 1
+        state.down = down
+        yards_to_go = state.yards_to_go - yards
+        yards_to_go[turnover | first_down] = 10
+        state.yards_to_go = yards_to_go
+        state.possession = state.possession ^ turnover
+
+        self.update_time(state, self.rng.integers(*PLAY_CLOCK, size=len(state)))
+        state.total_plays += 1
+
+        resolved = plays.copy()
+        resolved[touchdown] = TOUCHDOWN
+        resolved[on_downs] = TURNOVER_ON_DOWNS
+        return resolved
+
+    def update_time(self, state: BatchGameState, seconds: np.ndarray):
+        """Run every game clock, rolling over into the next quarter"""
+        state.time_remaining -= seconds
+        expired = state.time_remaining <= 0
+        state.quarter[expired] += 1
+        state.time_remaining[expired] = np.where(state.quarter[expired] <= 4, 900, 0)
+
+    def update_momentum(self, state: BatchGameState, plays: np.ndarray, yards: np.ndarray):
+        """Vectorized update_momentum"""
+        momentum_change = np.where(yards > 20, 0.15, np.where(yards > 10, 0.1, 0.0))
+        momentum_change = np.where(plays == TOUCHDOWN, 0.2, np.where(plays == FIELD_GOAL, 0.1, momentum_change))
+        momentum_change = np.where(
+            (plays == INTERCEPTION) | (plays == FUMBLE), -0.2,
+            np.where(yards < 0, -0.05, momentum_change)
+        )
+
+        momentum_change *= self.rng.normal(1, 0.2, len(state))
+        momentum = np.clip(state.momentum + momentum_change, 0, 1)
+
+        if state.momentum_sum is not None:
+            state.momentum_sum += momentum
+            state.momentum_sq_sum += momentum ** 2
+            state.momentum_path += np.where(state.total_plays > 1, np.abs(momentum - state.momentum), 0)
+        state.momentum = momentum
+
+    def update_quantum_memory(self, state: BatchGameState, plays: np.ndarray, yards: np.ndarray):
+        """Record play success in each game's entanglement window"""
+        success = (yards > 4) | (plays == FIELD_GOAL) | (plays == TOUCHDOWN)
+        state.memory.push(success, yards, plays)
+
+    def simulate_play(self, state: BatchGameState) -> np.ndarray:
+        """Simulate one play in every game of the batch"""
+        plays, yards = self.calculate_play_outcome(state)
+        plays = self.update_game_state(state, plays, yards)
+
+        self.update_momentum(state, plays, yards)
+        self.update_quantum_memory(state, plays, yards)
+
+        return plays
+
+    def summarize(self, state: BatchGameState, home_team: str, away_team: str,
+                  analysis: str = 'none') -> Dict:
+        """Aggregate score distributions over a finished batch"""
+        result = summarize_scores(home_team, away_team, state.home_score, state.away_score, state.total_plays)
+        result['quantum_analysis'] = self.analyze_quantum_effects(state, analysis)
+        return result
+
+    def analyze_quantum_effects(self, state: BatchGameState, level: str = 'summary') -> Dict:
+        """Momentum volatility and coherence from the running sums of each game"""
+        if level == 'none' or state.momentum_sum is None:
+            return None
+
+        plays = np.maximum(state.total_plays, 1)
+        mean = state.momentum_sum / plays
+        volatility = np.sqrt(np.maximum(state.momentum_sq_sum / plays - mean ** 2, 0))
+        coherence = state.momentum_path / np.maximum(state.total_plays - 1, 1)
+
+        analysis = {
+            'momentum_volatility': float(np.mean(volatility)),
+            'quantum_coherence': float(np.mean(coherence))
+        }
+        if level == 'full':
+            analysis['per_game'] = {
+                'momentum_volatility': volatility,
+                'quantum_coherence': coherence
+            }
+        return analysis
+
+def summarize_scores(home_team: str, away_team: str, home_scores: np.ndarray,
+                     away_scores: np.ndarray, total_plays: np.ndarray) -> Dict:
+    """Aggregate score, margin and win distributions over many games"""
+    margin = home_scores - away_scores
+    return {
+        'home_team': home_team,
+        'away_team': away_team,
+        'games': len(home_scores),
+        'home_scores': home_scores,
+        'away_scores': away_scores,
+        'home_win_prob': float(np.mean(margin > 0)),
+        'away_win_prob': float(np.mean(margin < 0)),
+        'tie_prob': float(np.mean(margin == 0)),
+        'mean_home_score': float(np.mean(home_scores)),
+        'mean_away_score': float(np.mean(away_scores)),
+        'mean_plays': float(np.mean(total_plays)),
+        'score_distribution': {
+            'home': np.bincount(home_scores),
+            'away': np.bincount(away_scores),
+            'margin': {int(m): int(c) for m, c in zip(*np.unique(margin, return_counts=True))}
+        }
+    }
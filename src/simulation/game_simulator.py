@@ -4,10 +4,49 @@ Simulates NFL games using quantum-inspired algorithms
 """
 
 import numpy as np
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Dict, List, Tuple
 from datetime import datetime
-from scipy.stats import norm
+from .rng import BlockRNG
+
+# Situational quantum interference factors
+SITUATION_FACTORS = {
+    'normal': 1.0,
+    'redzone': 1.2,
+    'thirddown': 1.1,
+    'fourthdown': 0.9,
+    'twominute': 1.15
+}
+
+# Every play outcome the simulator can produce, in play-type code order
+PLAY_TYPES = (
+    "Run",
+    "Breakaway run",
+    "Fumble",
+    "Pass complete",
+    "Deep pass complete",
+    "Incomplete pass",
+    "Interception",
+    "Punt",
+    "Punt and return",
+    "Field goal",
+    "Missed field goal",
+    "No play",
+    "Touchdown",
+    "Turnover on downs"
+)
+PLAY_TYPE_CODES = {play_type: code for code, play_type in enumerate(PLAY_TYPES)}
+
+# Plays that end the current drive
+DRIVE_ENDING_PLAYS = (
+    "Touchdown", "Field goal", "Missed field goal", "Punt", "Punt and return",
+    "Turnover on downs", "Interception", "Fumble"
+)
+
+# Seconds run off the clock per snap (low inclusive, high exclusive)
+PLAY_CLOCK = (25, 46)
 
 @dataclass
 class GameState:
@@ -34,90 +73,421 @@ class GameState:
         }
         self.plays = []
 
+# Columnar play record used by the compact play log
+PLAY_LOG_DTYPE = np.dtype([
+    ('quarter', np.int8),
+    ('time', np.int16),
+    ('possession', np.int8),  # 0 = home, 1 = away
+    ('play_type', np.int8),   # index into PLAY_TYPES
+    ('yards', np.int16),
+    ('field_position', np.int8),
+    ('home_score', np.int16),
+    ('away_score', np.int16),
+    ('momentum', np.float64)
+])
+
+class PlayLog:
+    """Preallocated structured-array play log for one game"""
+    
+    def __init__(self, home_team: str, away_team: str, quantum_state: Dict = None, capacity: int = 256):
+        self.home_team = home_team
+        self.away_team = away_team
+        self.quantum_state = dict(quantum_state or {})
+        self._data = np.zeros(capacity, dtype=PLAY_LOG_DTYPE)
+        self._size = 0
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def __getitem__(self, key):
+        """Column by field name, or rows by index/slice"""
+        return self.plays[key]
+        
+    @property
+    def plays(self) -> np.ndarray:
+        """View of the recorded plays"""
+        return self._data[:self._size]
+        
+    def append(self, game: GameState, play_type: str, yards: int):
+        """Record a play against the current game state"""
+        if self._size == len(self._data):
+            self._data = np.resize(self._data, 2 * len(self._data))
+            
+        self._data[self._size] = (
+            game.quarter,
+            game.time_remaining,
+            0 if game.possession == self.home_team else 1,
+            PLAY_TYPE_CODES[play_type],
+            yards,
+            game.field_position,
+            game.home_score,
+            game.away_score,
+            game.momentum
+        )
+        self._size += 1
+        
+    def to_dicts(self) -> List[Dict]:
+        """Per-play dicts matching the full play-log layout"""
+        teams = (self.home_team, self.away_team)
+        return [
+            {
+                'quarter': int(play['quarter']),
+                'time': int(play['time']),
+                'possession': teams[play['possession']],
+                'play_type': PLAY_TYPES[play['play_type']],
+                'yards': int(play['yards']),
+                'field_position': int(play['field_position']),
+                'score': f"{self.home_team} {play['home_score']} - {self.away_team} {play['away_score']}",
+                'momentum': float(play['momentum']),
+                'quantum_state': self.quantum_state.copy()
+            }
+            for play in self.plays
+        ]
+
+class GameSnapshot:
+    """Compact, restorable copy of a live game and the simulator state it depends on
+    
+    Holds the scoreboard, quantum states and entanglement memory but not the
+    play history, so taking one on every snap is cheap.
+    """
+    
+    __slots__ = (
+        'home_team', 'away_team', 'home_score', 'away_score', 'quarter', 'time_remaining',
+        'possession', 'field_position', 'down', 'yards_to_go', 'momentum',
+        'quantum_state', 'quantum_states', 'quantum_memory'
+    )
+    
+    def __init__(self, game: GameState, quantum_states: Dict[str, float], quantum_memory: 'QuantumMemory'):
+        self.home_team = game.home_team
+        self.away_team = game.away_team
+        self.home_score = game.home_score
+        self.away_score = game.away_score
+        self.quarter = game.quarter
+        self.time_remaining = game.time_remaining
+        self.possession = game.possession
+        self.field_position = game.field_position
+        self.down = game.down
+        self.yards_to_go = game.yards_to_go
+        self.momentum = float(game.momentum)
+        self.quantum_state = dict(game.quantum_state)
+        self.quantum_states = {
+            team: quantum_states[team] for team in (game.home_team, game.away_team) if team in quantum_states
+        }
+        self.quantum_memory = quantum_memory.copy()
+        
+    def to_game_state(self) -> GameState:
+        """Fresh GameState at this snapshot, with an empty play history"""
+        game = GameState(
+            home_team=self.home_team,
+            away_team=self.away_team,
+            home_score=self.home_score,
+            away_score=self.away_score,
+            quarter=self.quarter,
+            time_remaining=self.time_remaining,
+            possession=self.possession,
+            field_position=self.field_position,
+            down=self.down,
+            yards_to_go=self.yards_to_go,
+            momentum=self.momentum
+        )
+        game.quantum_state = dict(self.quantum_state)
+        return game
+
+class QuantumMemory:
+    """Fixed-size ring buffer of recent play outcomes for entanglement effects
+    
+    Keeps a running success sum over the last `window` plays so the
+    entanglement term is O(1). With `games` set, each game gets its own
+    buffer row; indexing then selects rows, so batches of games can share
+    one set of arrays.
+    """
+    
+    def __init__(self, capacity: int = 10, window: int = 3, games: int = None):
+        if not 0 < window <= capacity:
+            raise ValueError("window must be between 1 and capacity")
+        shape = (capacity,) if games is None else (games, capacity)
+        self.window = window
+        self.success = np.zeros(shape)
+        self.yards = np.zeros(shape, dtype=np.int32)
+        self.play_type = np.zeros(shape, dtype=np.int8)
+        if games is None:
+            self.count = 0
+            self.window_sum = 0.0
+        else:
+            self.count = np.zeros(games, dtype=np.int64)
+            self.window_sum = np.zeros(games)
+        
+    @property
+    def capacity(self) -> int:
+        return self.success.shape[-1]
+        
+    @property
+    def rows(self) -> bool:
+        return self.success.ndim == 2
+        
+    def push(self, success, yards=0, play_type=0):
+        """Record the latest play outcome (one value per row in 2-D form)"""
+        if not self.rows:
+            return self._push_one(success, yards, play_type)
+            
+        count = self.count
+        slot = count % self.capacity
+        
+        # Drop the play leaving the entanglement window from the running sum
+        leaving = (count - self.window) % self.capacity
+        expired = np.where(count >= self.window, self._at(leaving), 0.0)
+        
+        index = (np.arange(len(count)), slot)
+        self.success[index] = success
+        self.yards[index] = yards
+        self.play_type[index] = play_type
+        
+        self.window_sum = self.window_sum + success - expired
+        self.count = count + 1
+        
+    def _push_one(self, success: float, yards: int, play_type: int):
+        slot = self.count % self.capacity
+        if self.count >= self.window:
+            self.window_sum -= self.success[(self.count - self.window) % self.capacity]
+        self.success[slot] = success
+        self.yards[slot] = yards
+        self.play_type[slot] = play_type
+        self.window_sum += success
+        self.count += 1
+        
+    def _at(self, slot) -> np.ndarray:
+        return self.success[np.arange(len(self.count)), slot]
+        
+    def entanglement(self):
+        """Mean success over the entanglement window, 0.5 before any plays"""
+        if not self.rows:
+            filled = min(self.count, self.window)
+            return float(self.window_sum / filled) if filled else 0.5
+            
+        filled = np.minimum(self.count, self.window)
+        return np.where(filled > 0, self.window_sum / np.maximum(filled, 1), 0.5)
+        
+    def __len__(self) -> int:
+        if self.rows:
+            return len(self.count)
+        return int(min(self.count, self.capacity))
+        
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+            
+    def __getitem__(self, index):
+        """Row subset in 2-D form, otherwise the play dict at a recency index"""
+        if self.rows:
+            memory = QuantumMemory.__new__(QuantumMemory)
+            memory.window = self.window
+            for name in ('success', 'yards', 'play_type', 'count', 'window_sum'):
+                setattr(memory, name, getattr(self, name)[index])
+            return memory
+            
+        size = len(self)
+        if not -size <= index < size:
+            raise IndexError("quantum memory index out of range")
+        slot = (self.count - size + index % size) % self.capacity
+        return {
+            'play_type': PLAY_TYPES[self.play_type[slot]],
+            'yards': int(self.yards[slot]),
+            'success': float(self.success[slot])
+        }
+        
+    def copy(self) -> 'QuantumMemory':
+        """Independent copy of the buffer"""
+        memory = QuantumMemory.__new__(QuantumMemory)
+        memory.window = self.window
+        for name in ('success', 'yards', 'play_type', 'count', 'window_sum'):
+            value = getattr(self, name)
+            setattr(memory, name, value.copy() if isinstance(value, np.ndarray) else value)
+        return memory
+        
+    def recent_success(self) -> np.ndarray:
+        """Success flags inside the entanglement window, oldest first"""
+        filled = min(self.count, self.window)
+        slots = (self.count - filled + np.arange(filled)) % self.capacity
+        return self.success[slots]
+        
+    def __setitem__(self, index, other: 'QuantumMemory'):
+        """Scatter buffer rows back from a row subset"""
+        for name in ('success', 'yards', 'play_type', 'count', 'window_sum'):
+            getattr(self, name)[index] = getattr(other, name)
+
+# Levels accepted by the analysis option of simulate_game and the batch APIs
+ANALYSIS_LEVELS = ('none', 'summary', 'full')
+
+class LazyAnalysis(Mapping):
+    """Read-only mapping whose fields are computed on first access"""
+    
+    fields = ()
+    
+    def __getitem__(self, key):
+        if key not in self.fields:
+            raise KeyError(key)
+        return getattr(self, key)
+        
+    def __contains__(self, key) -> bool:
+        return key in self.fields
+        
+    def __iter__(self):
+        return iter(self.fields)
+        
+    def __len__(self) -> int:
+        return len(self.fields)
+        
+class InterferencePatterns(LazyAnalysis):
+    """Interference patterns in a play sequence; FFT and autocorrelation run on access"""
+    
+    def __init__(self, yards_sequence, momentum_sequence, level: str = 'full'):
+        self.yards_sequence = yards_sequence
+        self.momentum_sequence = momentum_sequence
+        self.fields = (
+            ('yards_autocorrelation', 'momentum_periodicity', 'quantum_coherence')
+            if level == 'full' else ('quantum_coherence',)
+        )
+        
+    @cached_property
+    def yards_autocorrelation(self) -> np.ndarray:
+        return np.correlate(self.yards_sequence, self.yards_sequence, mode='full')
+        
+    @cached_property
+    def momentum_periodicity(self) -> np.ndarray:
+        return np.fft.fft(self.momentum_sequence)
+        
+    @cached_property
+    def quantum_coherence(self) -> float:
+        return np.mean(np.abs(np.diff(self.momentum_sequence)))
+        
+class QuantumAnalysis(LazyAnalysis):
+    """Per-game quantum analysis computed field by field on access"""
+    
+    fields = ('momentum_volatility', 'quantum_stability', 'entanglement_strength', 'interference_patterns')
+    
+    def __init__(self, stats: Dict, level: str = 'full'):
+        self.stats = stats
+        self.level = level
+        
+    @cached_property
+    def _sequences(self) -> Dict:
+        plays = self.stats['plays']
+        if isinstance(plays, PlayLog):
+            # The quantum state is fixed for the game, so the log keeps it once
+            return {
+                'yards': plays['yards'].astype(np.int64),
+                'momentum': plays['momentum'],
+                'superposition': np.full(len(plays), plays.quantum_state['superposition']),
+                'entanglement': np.full(len(plays), plays.quantum_state['entanglement'])
+            }
+        return {
+            'yards': [p['yards'] for p in plays],
+            'momentum': self.stats['momentum_shifts'],
+            'superposition': [s['superposition'] for s in self.stats['quantum_states']],
+            'entanglement': [s['entanglement'] for s in self.stats['quantum_states']]
+        }
+        
+    @cached_property
+    def momentum_volatility(self) -> float:
+        return np.std(self._sequences['momentum'])
+        
+    @cached_property
+    def quantum_stability(self) -> float:
+        return np.mean(self._sequences['superposition'])
+        
+    @cached_property
+    def entanglement_strength(self) -> float:
+        return np.corrcoef(self._sequences['entanglement'], self._sequences['momentum'])[0,1]
+        
+    @cached_property
+    def interference_patterns(self) -> InterferencePatterns:
+        return InterferencePatterns(self._sequences['yards'], self._sequences['momentum'], self.level)
+
 class NFLQuantumSimulator:
-    def __init__(self):
+    def __init__(self, seed=None, memory_window: int = 3, memory_size: int = 10, rng=None):
+        # Any provider with Generator-style random/normal/integers can be injected
+        self.rng = rng if rng is not None else BlockRNG(seed)
         self.quantum_states = {}
         self.momentum_factors = {}
         self.weather_impact = 1.0
         self.historical_data = {}
-        self.quantum_memory = []
+        self.memory_window = memory_window
+        self.quantum_memory = QuantumMemory(memory_size, memory_window)
         
     def initialize_game(self, home_team: str, away_team: str) -> GameState:
         """Initialize a new game state with quantum properties"""
         game = GameState(home_team=home_team, away_team=away_team)
         
         # Initialize quantum states
-        self.quantum_states[home_team] = np.random.random()
+        self.quantum_states[home_team] = self.rng.random()
         self.quantum_states[away_team] = 1 - self.quantum_states[home_team]
         
         # Quantum coin toss using superposition
-        superposition = np.random.random() + self.quantum_states[home_team]
+        superposition = self.rng.random() + self.quantum_states[home_team]
         game.possession = home_team if superposition > 1 else away_team
         
         return game
         
-    def calculate_quantum_probability(self, base_prob: float, team: str, situation: str) -> float:
-        """Calculate probability using quantum mechanics principles"""
+    def play_terms(self, team: str, situation: str) -> Tuple[float, float, float]:
+        """Deterministic probability terms shared by every draw in one play
+        
+        Returns the team quantum offset, the entanglement offset and the
+        situation/weather scale. None of them changes until the play is applied,
+        so a play computes them once and each draw only adds noise.
+        """
+        team_offset = self.quantum_states.get(team, 0.5) - 0.5
+        entanglement = self.quantum_memory.entanglement()
+        situation_scale = SITUATION_FACTORS.get(situation, 1.0) * self.weather_impact
+        return team_offset, entanglement - 0.5, situation_scale
+        
+    def draw_probability(self, base_prob: float, terms: Tuple[float, float, float]) -> float:
+        """Quantum probability draw from precomputed play terms"""
+        team_offset, entanglement_offset, situation_scale = terms
+        
         # Quantum noise from uncertainty principle
-        quantum_noise = (np.random.random() - 0.5) * 0.2
-        
-        # Team's quantum state influence
-        team_quantum = self.quantum_states.get(team, 0.5)
-        
-        # Situational quantum interference
-        situation_factor = {
-            'normal': 1.0,
-            'redzone': 1.2,
-            'thirddown': 1.1,
-            'fourthdown': 0.9,
-            'twominute': 1.15
-        }.get(situation, 1.0)
-        
-        # Apply quantum entanglement with recent plays
-        if self.quantum_memory:
-            entanglement = np.mean([m['success'] for m in self.quantum_memory[-3:]])
-        else:
-            entanglement = 0.5
-            
-        # Calculate final probability
-        prob = base_prob + quantum_noise + (team_quantum - 0.5) + (entanglement - 0.5)
-        prob *= situation_factor * self.weather_impact
+        quantum_noise = (self.rng.random() - 0.5) * 0.2
         
-        return np.clip(prob, 0, 1)
+        prob = (base_prob + quantum_noise + team_offset + entanglement_offset) * situation_scale
+        return min(max(prob, 0.0), 1.0)
+        
+    def calculate_quantum_probability(self, base_prob: float, team: str, situation: str) -> float:
+        """Calculate probability using quantum mechanics principles"""
+        return self.draw_probability(base_prob, self.play_terms(team, situation))
         
     def calculate_play_outcome(self, game: GameState) -> Tuple[str, int]:
         """Calculate play outcome using quantum probability"""
-        # Determine situation
+        # Determine situation and the probability terms it fixes for this play
         situation = self.get_game_situation(game)
+        terms = self.play_terms(game.possession, situation)
         
         # Base probabilities with quantum adjustment
-        run_prob = self.calculate_quantum_probability(0.4, game.possession, situation)
-        pass_prob = self.calculate_quantum_probability(0.5, game.possession, situation)
+        run_prob = self.draw_probability(0.4, terms)
+        pass_prob = self.draw_probability(0.5, terms)
         
         # Generate play type using quantum randomness
-        play_random = np.random.random()
+        play_random = self.rng.random()
         
         if play_random < run_prob:
-            return self._simulate_run(game, situation)
+            return self._simulate_run(game, terms)
         elif play_random < run_prob + pass_prob:
-            return self._simulate_pass(game, situation)
+            return self._simulate_pass(game, terms)
         else:
-            return self._simulate_special_teams(game, situation)
+            return self._simulate_special_teams(game, terms)
             
-    def _simulate_run(self, game: GameState, situation: str) -> Tuple[str, int]:
+    def _simulate_run(self, game: GameState, terms: Tuple[float, float, float]) -> Tuple[str, int]:
         """Simulate a running play with quantum effects"""
         # Use normal distribution for base yards
-        base_yards = norm.rvs(loc=4, scale=2)
+        base_yards = self.rng.normal(4, 2)
         
         # Apply quantum factors
-        quantum_factor = self.calculate_quantum_probability(0.5, game.possession, situation)
+        quantum_factor = self.draw_probability(0.5, terms)
         momentum_boost = game.momentum * 2 - 1  # Convert 0-1 to -1 to 1
         
         # Calculate final yards
         yards = int(base_yards * (1 + quantum_factor + momentum_boost))
         
         # Special outcomes
-        if np.random.random() < self.calculate_quantum_probability(0.1, game.possession, situation):
+        if self.rng.random() < self.draw_probability(0.1, terms):
             if yards > 0:
                 yards *= 2  # Breakaway run
                 return "Breakaway run", yards
@@ -126,19 +496,19 @@ class NFLQuantumSimulator:
                 
         return "Run", yards
             
-    def _simulate_pass(self, game: GameState, situation: str) -> Tuple[str, int]:
+    def _simulate_pass(self, game: GameState, terms: Tuple[float, float, float]) -> Tuple[str, int]:
         """Simulate a passing play with quantum interference"""
-        completion_prob = self.calculate_quantum_probability(0.65, game.possession, situation)
+        completion_prob = self.draw_probability(0.65, terms)
         
-        if np.random.random() > completion_prob:
+        if self.rng.random() > completion_prob:
             # Incomplete or interception
-            if np.random.random() < self.calculate_quantum_probability(0.15, game.possession, situation):
+            if self.rng.random() < self.draw_probability(0.15, terms):
                 return "Interception", 0
             return "Incomplete pass", 0
             
         # Complete pass yards with quantum distribution
-        base_yards = norm.rvs(loc=8, scale=4)
-        quantum_factor = self.calculate_quantum_probability(0.5, game.possession, situation)
+        base_yards = self.rng.normal(8, 4)
+        quantum_factor = self.draw_probability(0.5, terms)
         momentum_boost = game.momentum * 2 - 1
         
         yards = int(base_yards * (1 + quantum_factor + momentum_boost))
@@ -147,29 +517,25 @@ class NFLQuantumSimulator:
             return "Deep pass complete", yards
         return "Pass complete", yards
             
-    def _simulate_special_teams(self, game: GameState, situation: str) -> Tuple[str, int]:
+    def _simulate_special_teams(self, game: GameState, terms: Tuple[float, float, float]) -> Tuple[str, int]:
         """Simulate special teams play with quantum uncertainty"""
         if game.down == 4:
             if game.field_position < 65:
                 # Punt with quantum effects
-                base_distance = norm.rvs(loc=40, scale=5)
-                quantum_factor = self.calculate_quantum_probability(0.5, game.possession, situation)
+                base_distance = self.rng.normal(40, 5)
+                quantum_factor = self.draw_probability(0.5, terms)
                 distance = int(base_distance * (1 + quantum_factor))
                 
                 # Possible return
-                if np.random.random() < self.calculate_quantum_probability(0.2, game.possession, situation):
-                    return_yards = int(norm.rvs(loc=10, scale=5))
+                if self.rng.random() < self.draw_probability(0.2, terms):
+                    return_yards = int(self.rng.normal(10, 5))
                     return "Punt and return", -(distance - return_yards)
                 return "Punt", -distance
             else:
                 # Field goal attempt
                 distance = 100 - game.field_position + 17
-                success_prob = self.calculate_quantum_probability(
-                    1 - (distance - 20) / 50,
-                    game.possession,
-                    situation
-                )
-                if np.random.random() < success_prob:
+                success_prob = self.draw_probability(1 - (distance - 20) / 50, terms)
+                if self.rng.random() < success_prob:
                     return "Field goal", 3
                 return "Missed field goal", 0
         return "No play", 0
@@ -186,6 +552,70 @@ class NFLQuantumSimulator:
             return 'twominute'
         return 'normal'
         
+    def update_score(self, game: GameState, points: int):
+        """Credit points to the team in possession"""
+        if game.possession == game.home_team:
+            game.home_score += points
+        else:
+            game.away_score += points
+            
+    def change_possession(self, game: GameState, field_position: int):
+        """Hand the ball to the other team at the given field position"""
+        game.possession = game.away_team if game.possession == game.home_team else game.home_team
+        game.field_position = field_position
+        game.down = 1
+        game.yards_to_go = 10
+        
+    def update_field_position(self, game: GameState, yards: int) -> bool:
+        """Advance the ball, returning True when the drive ends in a touchdown"""
+        game.field_position += yards
+        if game.field_position >= 100:
+            self.update_score(game, 7)
+            self.change_possession(game, 20)
+            return True
+        game.field_position = max(game.field_position, 1)
+        return False
+        
+    def update_time(self, game: GameState, seconds: int):
+        """Run the game clock, rolling over into the next quarter"""
+        game.time_remaining -= seconds
+        if game.time_remaining <= 0:
+            game.quarter += 1
+            game.time_remaining = 900 if game.quarter <= 4 else 0
+            
+    def update_game_state(self, game: GameState, play_result: Tuple[str, int]) -> Tuple[str, int]:
+        """Apply a play to the game state and return the resolved play result"""
+        play_type, yards = play_result
+        
+        if play_type == "Field goal":
+            self.update_score(game, 3)
+            self.change_possession(game, 20)
+        elif play_type == "Missed field goal":
+            self.change_possession(game, 100 - game.field_position)
+        elif play_type in ("Punt", "Punt and return"):
+            landing = game.field_position - yards
+            self.change_possession(game, 20 if landing >= 100 else max(100 - landing, 1))
+        elif play_type == "Interception":
+            self.change_possession(game, 100 - game.field_position)
+        elif play_type == "Fumble":
+            self.change_possession(game, int(np.clip(100 - (game.field_position + yards), 1, 99)))
+        elif self.update_field_position(game, yards):
+            play_type = "Touchdown"
+        elif yards >= game.yards_to_go:
+            game.down = 1
+            game.yards_to_go = 10
+        else:
+            game.down += 1
+            game.yards_to_go -= yards
+            if game.down > 4:
+                self.change_possession(game, 100 - game.field_position)
+                play_type = "Turnover on downs"
+                
+        self.update_time(game, int(self.rng.integers(*PLAY_CLOCK)))
+        game.plays.append((play_type, yards))
+        
+        return play_type, yards
+        
     def update_momentum(self, game: GameState, play_type: str, yards: int):
         """Update momentum based on play outcome"""
         momentum_change = 0
@@ -209,7 +639,7 @@ class NFLQuantumSimulator:
             momentum_change = -0.05
             
         # Apply quantum uncertainty to momentum change
-        quantum_factor = np.random.normal(1, 0.2)
+        quantum_factor = self.rng.normal(1, 0.2)
         momentum_change *= quantum_factor
         
         # Update momentum
@@ -218,15 +648,7 @@ class NFLQuantumSimulator:
     def update_quantum_memory(self, play_type: str, yards: int):
         """Update quantum memory for entanglement effects"""
         success = (yards > 4) or (play_type in ["Field goal", "Touchdown"])
-        self.quantum_memory.append({
-            'play_type': play_type,
-            'yards': yards,
-            'success': float(success)
-        })
-        
-        # Keep last 10 plays
-        if len(self.quantum_memory) > 10:
-            self.quantum_memory.pop(0)
+        self.quantum_memory.push(float(success), yards, PLAY_TYPE_CODES[play_type])
             
     def simulate_play(self, game: GameState) -> Tuple[str, int]:
         """Simulate a single play with full quantum effects"""
@@ -234,7 +656,7 @@ class NFLQuantumSimulator:
         play_result = self.calculate_play_outcome(game)
         
         # Update game state
-        self.update_game_state(game, play_result)
+        play_result = self.update_game_state(game, play_result)
         
         # Update quantum effects
         self.update_momentum(game, play_result[0], play_result[1])
@@ -242,9 +664,23 @@ class NFLQuantumSimulator:
         
         return play_result
         
-    def simulate_game(self, home_team: str, away_team: str) -> Dict:
-        """Simulate an entire NFL game with quantum mechanics"""
+    def simulate_game(self, home_team: str, away_team: str, play_log: str = 'full',
+                      analysis: str = 'full') -> Dict:
+        """Simulate an entire NFL game with quantum mechanics
+        
+        play_log='compact' records plays into a PlayLog of structured arrays
+        instead of per-play dicts; PlayLog.to_dicts() gives the full view.
+        analysis selects the quantum analysis tier: 'none' skips it,
+        'summary' leaves out the autocorrelation and FFT, and 'full' computes
+        every field lazily on access.
+        """
+        if analysis not in ANALYSIS_LEVELS:
+            raise ValueError(f"analysis must be one of {ANALYSIS_LEVELS}")
+            
         game = self.initialize_game(home_team, away_team)
+        if play_log == 'compact':
+            return self._simulate_game_compact(game, analysis)
+            
         stats = {
             'plays': [],
             'quantum_states': [],
@@ -270,21 +706,165 @@ class NFLQuantumSimulator:
             })
             
             # Check for drive end
-            if play_result[0] in ["Touchdown", "Field goal", "Punt", "Turnover on downs", "Interception", "Fumble"]:
+            if play_result[0] in DRIVE_ENDING_PLAYS:
                 stats['drive_summary'].append(self.analyze_drive(current_drive))
                 current_drive = []
             
             stats['quantum_states'].append(game.quantum_state.copy())
             stats['momentum_shifts'].append(game.momentum)
             
+        return self._game_result(game, stats, analysis)
+        
+    def _simulate_game_compact(self, game: GameState, analysis: str) -> Dict:
+        """Simulate a game into a columnar PlayLog"""
+        log = PlayLog(game.home_team, game.away_team, game.quantum_state)
+        stats = {
+            'plays': log,
+            'drive_summary': []
+        }
+        
+        drive_start = 0
+        while game.quarter <= 4 and game.time_remaining > 0:
+            play_type, yards = self.simulate_play(game)
+            log.append(game, play_type, yards)
+            
+            if play_type in DRIVE_ENDING_PLAYS:
+                stats['drive_summary'].append(self.analyze_drive(log[drive_start:]))
+                drive_start = len(log)
+                
+        return self._game_result(game, stats, analysis)
+        
+    def _game_result(self, game: GameState, stats: Dict, analysis: str) -> Dict:
+        """Final result dict for a completed game"""
         return {
             'final_score': f"{game.home_team} {game.home_score} - {game.away_team} {game.away_score}",
+            'home_score': game.home_score,
+            'away_score': game.away_score,
             'stats': stats,
-            'quantum_analysis': self.analyze_quantum_effects(stats)
+            'quantum_analysis': self.analyze_quantum_effects(stats, analysis) if analysis != 'none' else None
+        }
+        
+    def simulate_games_batch(self, home_team: str, away_team: str, n: int,
+                             analysis: str = 'none') -> Dict:
+        """Simulate N independent games in lockstep and aggregate the scores"""
+        from .batch_simulator import BatchGameSimulator
+        
+        batch = BatchGameSimulator(self)
+        return batch.summarize(batch.simulate(n, analysis), home_team, away_team, analysis)
+        
+    def snapshot(self, game: GameState) -> GameSnapshot:
+        """Capture a live game so it can be restored or forked later"""
+        return GameSnapshot(game, self.quantum_states, self.quantum_memory)
+        
+    def restore(self, snapshot: GameSnapshot) -> GameState:
+        """Rewind the simulator to a snapshot and return its game state"""
+        self.quantum_states.update(snapshot.quantum_states)
+        self.quantum_memory = snapshot.quantum_memory.copy()
+        return snapshot.to_game_state()
+        
+    def simulate_from(self, state, n: int, analysis: str = 'none') -> Dict:
+        """Fork N batch continuations from a live game or snapshot to the final whistle"""
+        from .batch_simulator import BatchGameSimulator, BatchGameState
+        
+        if isinstance(state, GameState):
+            state = self.snapshot(state)
+            
+        batch = BatchGameSimulator(self)
+        games = BatchGameState.from_snapshot(state, n, self.memory_window, track_momentum=analysis != 'none')
+        return batch.summarize(batch.simulate(n, analysis, games), state.home_team, state.away_team, analysis)
+        
+    def simulate_tournament(self, teams: List) -> Dict:
+        """Single-elimination tournament, playing each round as one batch"""
+        from .batch_simulator import BatchGameSimulator
+        
+        batch = BatchGameSimulator(self)
+        bracket = [getattr(team, 'name', team) for team in teams]
+        rounds = []
+        while len(bracket) > 1:
+            # An odd team out gets a bye into the next round
+            byes = [bracket.pop()] if len(bracket) % 2 else []
+            home, away = bracket[0::2], bracket[1::2]
+            
+            state = batch.simulate(len(home))
+            margin = state.home_score - state.away_score
+            # Ties are settled by a quantum coin toss
+            home_wins = (margin > 0) | ((margin == 0) & (self.rng.random(len(home)) < 0.5))
+            
+            games = [
+                {
+                    'home_team': h,
+                    'away_team': a,
+                    'home_score': int(hs),
+                    'away_score': int(aws),
+                    'winner': h if won else a
+                }
+                for h, a, hs, aws, won in zip(home, away, state.home_score, state.away_score, home_wins)
+            ]
+            rounds.append(games)
+            bracket = byes + [game['winner'] for game in games]
+            
+        return {
+            'champion': bracket[0] if bracket else None,
+            'rounds': rounds
+        }
+        
+    def analyze_game_drives(self, past_games: int = 100, quantum_factors: bool = True,
+                            detailed_stats: bool = False, home_team: str = "GB",
+                            away_team: str = "CHI") -> Dict:
+        """Simulate a run of games and summarize their drives"""
+        drives = []
+        volatility = []
+        coherence = []
+        for _ in range(past_games):
+            result = self.simulate_game(
+                home_team, away_team, play_log='compact',
+                analysis='summary' if quantum_factors else 'none'
+            )
+            drives.extend(result['stats']['drive_summary'])
+            if quantum_factors:
+                analysis = result['quantum_analysis']
+                volatility.append(analysis['momentum_volatility'])
+                coherence.append(analysis['interference_patterns']['quantum_coherence'])
+                
+        results = [drive['result'] for drive in drives]
+        summary = {
+            'games': past_games,
+            'drives': len(drives),
+            'avg_plays': np.mean([drive['plays'] for drive in drives]) if drives else 0.0,
+            'avg_yards': np.mean([drive['yards'] for drive in drives]) if drives else 0.0,
+            'success_rate': np.mean([drive['success_rate'] for drive in drives]) if drives else 0.0,
+            'results': {result: results.count(result) for result in set(results)}
         }
         
-    def analyze_drive(self, drive: List[Tuple[str, int]]) -> Dict:
-        """Analyze a single drive"""
+        if quantum_factors:
+            summary['quantum_factors'] = {
+                'momentum_volatility': np.mean(volatility) if volatility else 0.0,
+                'quantum_coherence': np.mean(coherence) if coherence else 0.0
+            }
+            
+        if detailed_stats:
+            summary['by_result'] = {
+                result: {
+                    'drives': count,
+                    'avg_plays': np.mean([d['plays'] for d in drives if d['result'] == result]),
+                    'avg_yards': np.mean([d['yards'] for d in drives if d['result'] == result])
+                }
+                for result, count in summary['results'].items()
+            }
+            
+        return summary
+        
+    def analyze_drive(self, drive) -> Dict:
+        """Analyze a single drive from play tuples or PlayLog rows"""
+        if isinstance(drive, np.ndarray):
+            yards = drive['yards']
+            return {
+                'plays': len(drive),
+                'yards': int(yards.sum()),
+                'success_rate': np.count_nonzero(yards > 4) / len(drive),
+                'result': PLAY_TYPES[drive['play_type'][-1]] if len(drive) else "Unknown"
+            }
+            
         return {
             'plays': len(drive),
             'yards': sum(play[1] for play in drive),
@@ -292,28 +872,15 @@ class NFLQuantumSimulator:
             'result': drive[-1][0] if drive else "Unknown"
         }
         
-    def analyze_quantum_effects(self, stats: Dict) -> Dict:
+    def analyze_quantum_effects(self, stats: Dict, level: str = 'full') -> QuantumAnalysis:
         """Analyze quantum effects throughout the game"""
-        return {
-            'momentum_volatility': np.std(stats['momentum_shifts']),
-            'quantum_stability': np.mean([s['superposition'] for s in stats['quantum_states']]),
-            'entanglement_strength': np.corrcoef(
-                [s['entanglement'] for s in stats['quantum_states']],
-                stats['momentum_shifts']
-            )[0,1],
-            'interference_patterns': self.detect_interference_patterns(stats['plays'])
-        }
+        return QuantumAnalysis(stats, level)
         
-    def detect_interference_patterns(self, plays: List[Dict]) -> Dict:
+    def detect_interference_patterns(self, plays) -> InterferencePatterns:
         """Detect quantum interference patterns in play sequences"""
-        yards_sequence = [p['yards'] for p in plays]
-        momentum_sequence = [p['momentum'] for p in plays]
-        
-        return {
-            'yards_autocorrelation': np.correlate(yards_sequence, yards_sequence, mode='full'),
-            'momentum_periodicity': np.fft.fft(momentum_sequence),
-            'quantum_coherence': np.mean(np.abs(np.diff(momentum_sequence)))
-        }
+        if isinstance(plays, PlayLog):
+            return InterferencePatterns(plays['yards'].astype(np.int64), plays['momentum'])
+        return InterferencePatterns([p['yards'] for p in plays], [p['momentum'] for p in plays])
 
 def main():
     """Test the game simulator"""
@@ -0,0 +1,73 @@
+"""
+NFL Quantum Parallel Monte Carlo Runner
+Spreads simulate_game calls across worker processes with reproducible seeding
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Tuple
+from .game_simulator import NFLQuantumSimulator
+from .batch_simulator import summarize_scores
+
+def simulate_chunk(home_team: str, away_team: str, start: int, games: int,
+                   entropy: int, weather_impact: float = 1.0) -> Tuple[np.ndarray, ...]:
+    """Play games start..start+games-1, each on a fresh simulator with its own Generator
+
+    Game i is seeded from child i of the root SeedSequence, rebuilt here from
+    the root entropy, so its result does not depend on how games are chunked.
+    """
+    home_scores = np.empty(games, dtype=np.int32)
+    away_scores = np.empty(games, dtype=np.int32)
+    total_plays = np.empty(games, dtype=np.int32)
+    for i in range(games):
+        simulator = NFLQuantumSimulator(seed=np.random.SeedSequence(entropy, spawn_key=(start + i,)))
+        simulator.weather_impact = weather_impact
+        result = simulator.simulate_game(home_team, away_team, play_log='compact', analysis='none')
+        home_scores[i] = result['home_score']
+        away_scores[i] = result['away_score']
+        total_plays[i] = len(result['stats']['plays'])
+
+    return home_scores, away_scores, total_plays
+
+class ParallelGameRunner:
+    """Process-pool Monte Carlo runner for NFLQuantumSimulator.simulate_game
+
+    Every game is seeded from its own child of a SeedSequence built from the
+    root seed on each call, and chunks only group games into pool tasks. A run
+    is bit-identical for a given seed however many workers are used, whatever
+    the chunk size, and however often the runner is called.
+    """
+
+    def __init__(self, seed=None, workers: int = None, chunk_size: int = 64):
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.weather_impact = 1.0
+
+    def simulate_games(self, home_team: str, away_team: str, n: int) -> Dict:
+        """Simulate N games across the pool and aggregate the scores"""
+        home_scores = np.empty(n, dtype=np.int32)
+        away_scores = np.empty(n, dtype=np.int32)
+        total_plays = np.empty(n, dtype=np.int32)
+
+        entropy = np.random.SeedSequence(self.seed).entropy
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    simulate_chunk, home_team, away_team, start,
+                    min(self.chunk_size, n - start), entropy, self.weather_impact
+                ): start
+                for start in range(0, n, self.chunk_size)
+            }
+
+            # Merge each chunk into place as soon as it finishes
+            for future in as_completed(futures):
+                start = futures[future]
+                chunk_home, chunk_away, chunk_plays = future.result()
+                end = start + len(chunk_home)
+                home_scores[start:end] = chunk_home
+                away_scores[start:end] = chunk_away
+                total_plays[start:end] = chunk_plays
+
+        return summarize_scores(home_team, away_team, home_scores, away_scores, total_plays)
@@ -0,0 +1,57 @@
+"""
+NFL Quantum Random Number Providers
+Pre-drawn random blocks for the play-by-play simulator
+"""
+
+import numpy as np
+
+class BlockRNG:
+    """Random provider that hands out pre-drawn blocks by cursor
+
+    Scalar draws come from blocks of uniforms and standard normals drawn in
+    bulk from a np.random.Generator, avoiding a NumPy call per value. Draws
+    with a size go straight to the generator, so the provider can stand in
+    for a Generator in both the scalar and the batch simulators.
+    """
+
+    def __init__(self, seed=None, block_size: int = 4096):
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self._uniforms = []
+        self._uniform_cursor = 0
+        self._normals = []
+        self._normal_cursor = 0
+
+    def _next_uniform(self) -> float:
+        if self._uniform_cursor == len(self._uniforms):
+            self._uniforms = self.generator.random(self.block_size).tolist()
+            self._uniform_cursor = 0
+        value = self._uniforms[self._uniform_cursor]
+        self._uniform_cursor += 1
+        return value
+
+    def _next_normal(self) -> float:
+        if self._normal_cursor == len(self._normals):
+            self._normals = self.generator.standard_normal(self.block_size).tolist()
+            self._normal_cursor = 0
+        value = self._normals[self._normal_cursor]
+        self._normal_cursor += 1
+        return value
+
+    def random(self, size=None):
+        """Uniform draw(s) on [0, 1)"""
+        if size is None:
+            return self._next_uniform()
+        return self.generator.random(size)
+
+    def normal(self, loc: float = 0.0, scale: float = 1.0, size=None):
+        """Normal draw(s) with the given mean and standard deviation"""
+        if size is None:
+            return loc + scale * self._next_normal()
+        return self.generator.normal(loc, scale, size)
+
+    def integers(self, low: int, high: int, size=None):
+        """Integer draw(s) on [low, high)"""
+        if size is None:
+            return low + int(self._next_uniform() * (high - low))
+        return self.generator.integers(low, high, size=size)
@@ -0,0 +1,164 @@
+"""
+NFL Quantum Season Simulator
+Runs full 17-week schedules through the batch engine across worker processes
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+from .game_simulator import NFLQuantumSimulator
+from .batch_simulator import BatchGameSimulator
+
+NFL_DIVISIONS = {
+    'AFC East': ['BUF', 'MIA', 'NE', 'NYJ'],
+    'AFC North': ['BAL', 'CIN', 'CLE', 'PIT'],
+    'AFC South': ['HOU', 'IND', 'JAX', 'TEN'],
+    'AFC West': ['DEN', 'KC', 'LV', 'LAC'],
+    'NFC East': ['DAL', 'NYG', 'PHI', 'WAS'],
+    'NFC North': ['CHI', 'DET', 'GB', 'MIN'],
+    'NFC South': ['ATL', 'CAR', 'NO', 'TB'],
+    'NFC West': ['ARI', 'LAR', 'SF', 'SEA']
+}
+NFL_TEAMS = [team for division in NFL_DIVISIONS.values() for team in division]
+
+# Playoff spots per conference
+PLAYOFF_SPOTS = 7
+
+def generate_schedule(teams: List[str] = None, weeks: int = 17) -> List[List[Tuple[str, str]]]:
+    """Round-robin schedule: every team plays once a week, never the same opponent twice"""
+    teams = list(teams or NFL_TEAMS)
+    if len(teams) % 2:
+        raise ValueError("schedule needs an even number of teams")
+    if weeks >= len(teams):
+        raise ValueError("not enough opponents for that many weeks")
+
+    # Circle method: fix the first team and rotate the rest
+    fixed, rotating = teams[0], teams[1:]
+    schedule = []
+    for week in range(weeks):
+        lineup = [fixed] + rotating
+        half = len(lineup) // 2
+        games = []
+        for i in range(half):
+            home, away = lineup[i], lineup[-1 - i]
+            games.append((home, away) if (week + i) % 2 == 0 else (away, home))
+        schedule.append(games)
+        rotating = rotating[-1:] + rotating[:-1]
+
+    return schedule
+
+def simulate_season_chunk(home_index: np.ndarray, away_index: np.ndarray, n_teams: int, seasons: int,
+                          seed: np.random.SeedSequence, weather_impact: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Play every scheduled game for a chunk of seasons in one batch"""
+    simulator = NFLQuantumSimulator(seed=seed)
+    simulator.weather_impact = weather_impact
+    state = BatchGameSimulator(simulator).simulate(seasons * len(home_index))
+
+    margin = (state.home_score - state.away_score).reshape(seasons, len(home_index))
+    wins = np.zeros((seasons, n_teams), dtype=np.int16)
+    ties = np.zeros((seasons, n_teams), dtype=np.int16)
+    rows = np.arange(seasons)[:, None]
+    np.add.at(wins, (rows, home_index), margin > 0)
+    np.add.at(wins, (rows, away_index), margin < 0)
+    np.add.at(ties, (rows, home_index), margin == 0)
+    np.add.at(ties, (rows, away_index), margin == 0)
+
+    return wins, ties
+
+class SeasonSimulator:
+    """Monte Carlo season engine producing standings distributions
+
+    Seasons are split into fixed-size chunks seeded from their own children of
+    a SeedSequence built from the root seed on each call, so results do not
+    depend on the worker count or on earlier calls.
+    """
+
+    def __init__(self, seed=None, workers: int = None, chunk_size: int = 50):
+        self.seed = seed
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.weather_impact = 1.0
+
+    def seed_streams(self) -> List[np.random.SeedSequence]:
+        """Fresh game and tiebreak SeedSequences for the root seed"""
+        return np.random.SeedSequence(self.seed).spawn(2)
+
+    def simulate_seasons(self, schedule: List[List[Tuple[str, str]]] = None, n_seasons: int = 1000) -> Dict:
+        """Simulate a schedule many times and summarize the standings"""
+        schedule = schedule or generate_schedule()
+        games = [game for week in schedule for game in week]
+        teams = sorted({team for game in games for team in game})
+        index = {team: i for i, team in enumerate(teams)}
+        home_index = np.array([index[home] for home, _ in games])
+        away_index = np.array([index[away] for _, away in games])
+
+        wins = np.empty((n_seasons, len(teams)), dtype=np.int16)
+        ties = np.empty((n_seasons, len(teams)), dtype=np.int16)
+        starts = range(0, n_seasons, self.chunk_size)
+        game_stream, _ = self.seed_streams()
+        seeds = game_stream.spawn(len(starts))
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    simulate_season_chunk, home_index, away_index, len(teams),
+                    min(self.chunk_size, n_seasons - start), seed, self.weather_impact
+                ): start
+                for start, seed in zip(starts, seeds)
+            }
+
+            # Merge each chunk of seasons into place as soon as it finishes
+            for future in as_completed(futures):
+                start = futures[future]
+                chunk_wins, chunk_ties = future.result()
+                wins[start:start + len(chunk_wins)] = chunk_wins
+                ties[start:start + len(chunk_ties)] = chunk_ties
+
+        return self.summarize_standings(teams, wins, ties, len(schedule))
+
+    def summarize_standings(self, teams: List[str], wins: np.ndarray, ties: np.ndarray, weeks: int) -> Dict:
+        """Win distributions, division titles and playoff odds per team"""
+        n_seasons = len(wins)
+        # Win percentage points with a random tiebreak below one half game
+        _, tiebreak_stream = self.seed_streams()
+        rng = np.random.default_rng(tiebreak_stream)
+        points = wins + 0.5 * ties + rng.random(wins.shape) * 0.1
+
+        division_titles = np.zeros(len(teams))
+        playoffs = np.zeros(len(teams))
+        index = {team: i for i, team in enumerate(teams)}
+        for conference in ('AFC', 'NFC'):
+            divisions = [
+                [index[t] for t in members if t in index]
+                for name, members in NFL_DIVISIONS.items() if name.startswith(conference)
+            ]
+            divisions = [d for d in divisions if d]
+            if not divisions:
+                continue
+
+            winners = np.stack([np.array(d)[np.argmax(points[:, d], axis=1)] for d in divisions], axis=1)
+            np.add.at(division_titles, winners.ravel(), 1)
+
+            # Division winners plus the best remaining records make the playoffs
+            members = np.concatenate(divisions)
+            ranked = points[:, members].copy()
+            ranked[(members[None, :, None] == winners[:, None, :]).any(axis=2)] = np.inf
+            wildcard = members[np.argsort(-ranked, axis=1)[:, :PLAYOFF_SPOTS]]
+            np.add.at(playoffs, wildcard.ravel(), 1)
+
+        return {
+            'teams': teams,
+            'seasons': n_seasons,
+            'wins': wins,
+            'ties': ties,
+            'mean_wins': dict(zip(teams, wins.mean(axis=0).tolist())),
+            'win_distribution': {
+                team: np.bincount(wins[:, i], minlength=weeks + 1) / n_seasons
+                for i, team in enumerate(teams)
+            },
+            'division_title_prob': dict(zip(teams, (division_titles / n_seasons).tolist())),
+            'playoff_prob': dict(zip(teams, (playoffs / n_seasons).tolist())),
+            'best_record_prob': dict(zip(
+                teams, (np.bincount(np.argmax(points, axis=1), minlength=len(teams)) / n_seasons).tolist()
+            ))
+        }
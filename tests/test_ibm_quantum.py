@@ -0,0 +1,286 @@
+"""
+Tests for the IBM Quantum circuit backends
+"""
+import subprocess
+import sys
+import pytest
+import numpy as np
+from src.ibm_quantum import backend, bracket, metrics, momentum, sampling, statevector
+from src.ibm_quantum.analyzer import NFLQuantumAnalyzer
+from src.ibm_quantum.circuits import NFLQuantumCircuits
+from src.ibm_quantum.predictor import NFLQuantumPredictor
+
+PACKERS_METRICS = {'offensive_power': 0.85, 'defensive_power': 0.78, 'momentum': 0.92}
+NINERS_METRICS = {'offensive_power': 0.90, 'defensive_power': 0.88, 'momentum': 0.95}
+
+def score_distribution(metrics):
+    """Closed-form distribution of measured ones for a team circuit"""
+    offense, defense, momentum = (np.sin(np.arccos(np.sqrt(metrics[name])) / 2) ** 2
+                                  for name in statevector.TEAM_METRICS)
+    distribution = np.zeros(6)
+    for o in (0, 1):
+        for d in (0, 1):
+            for m in (0, 1):
+                distribution[2 * o + 2 * d + m] += (
+                    (offense if o else 1 - offense) * (defense if d else 1 - defense)
+                    * (momentum if m else 1 - momentum)
+                )
+    return distribution
+
+def test_team_statevector():
+    """Test team statevectors are normalized and read-only"""
+    state = statevector.team_statevector(statevector.metric_key(PACKERS_METRICS))
+
+    assert state.shape == (32,)
+    assert np.linalg.norm(state) == pytest.approx(1)
+    assert not state.flags.writeable
+
+def test_exact_game_probabilities():
+    """Test exact win probabilities match the measurement distribution"""
+    home, away = score_distribution(PACKERS_METRICS), score_distribution(NINERS_METRICS)
+    expected = sum(home[i] * away[j] for i in range(6) for j in range(6) if i > j)
+
+    result = statevector.game_probabilities(
+        statevector.metric_key(PACKERS_METRICS), statevector.metric_key(NINERS_METRICS)
+    )
+
+    assert result['home_win_prob'] == pytest.approx(expected)
+    assert result['home_win_prob'] + result['away_win_prob'] == pytest.approx(1)
+
+def test_game_probability_cache():
+    """Test repeated matchups are served from the cache"""
+    statevector.game_probabilities.cache_clear()
+    home = statevector.metric_key(PACKERS_METRICS)
+    away = statevector.metric_key({name: value + 1e-9 for name, value in NINERS_METRICS.items()})
+
+    statevector.game_probabilities(home, away)
+    statevector.game_probabilities(home, statevector.metric_key(NINERS_METRICS))
+
+    assert statevector.game_probabilities.cache_info().hits == 1
+
+def test_win_probability_matrix():
+    """Test the league matrix matches individual exact matchups"""
+    metrics = np.random.default_rng(0).random((32, 3))
+
+    matrix = statevector.win_probability_matrix(metrics, block=10)
+
+    assert matrix.shape == (32, 32)
+    for i, j in [(0, 1), (3, 5), (31, 12)]:
+        expected = statevector.game_probabilities(tuple(metrics[i]), tuple(metrics[j]))['home_win_prob']
+        assert matrix[i, j] == pytest.approx(expected)
+
+def test_nfl_playoff_bracket():
+    """Test the 14-team bracket pairs seeds and conserves probability"""
+    metrics = np.random.default_rng(1).random((bracket.NFL_PLAYOFF_TEAMS, 3))
+
+    result = bracket.PlayoffBracket(statevector.win_probability_matrix(metrics)).simulate()
+
+    assert [game[:2] for game in result['first_round']] == bracket.first_round_games(14)
+    assert bracket.first_round_games(14)[:3] == [(1, 6), (2, 5), (3, 4)]
+    assert result['advancement'][[0, 7], 1] == pytest.approx([1, 1])
+    assert result['advancement'][:, 1:].sum(axis=0) == pytest.approx([8, 4, 2, 1])
+
+def test_single_elimination_bracket():
+    """Test a four-team bracket against the closed form"""
+    win = np.random.default_rng(2).random((4, 4))
+    playoffs = bracket.PlayoffBracket(win)
+
+    result = playoffs.simulate()
+
+    final_13 = playoffs.game_probability(0, 3) * playoffs.game_probability(1, 2)
+    final_12 = playoffs.game_probability(0, 3) * playoffs.game_probability(2, 1)
+    expected = playoffs.game_probability(0, 3) * (
+        playoffs.game_probability(1, 2) * win[0, 1] + playoffs.game_probability(2, 1) * win[0, 2]
+    )
+    assert bracket.first_round_games(4) == [(0, 3), (1, 2)]
+    assert result['advancement'][0, 1] == pytest.approx(final_13 + final_12)
+    assert result['champion_prob'][0] == pytest.approx(expected)
+    assert result['champion_prob'].sum() == pytest.approx(1)
+
+def binomial_sampler(home_win_prob, seed=0):
+    """Game counts with home wins as '0000011111' and losses as '1111100000'"""
+    rng = np.random.default_rng(seed)
+    def sample(shots):
+        wins = int(rng.binomial(shots, home_win_prob))
+        return {'0000011111': wins, '1111100000': shots - wins}
+    return sample
+
+def test_wilson_interval():
+    """Test the Wilson interval against a known value"""
+    lower, upper = sampling.wilson_interval(50, 100)
+
+    assert (lower, upper) == pytest.approx((0.4038, 0.5962), abs=1e-4)
+    assert sampling.wilson_interval(0, 0) == (0.0, 1.0)
+
+def test_adaptive_shots():
+    """Test lopsided games stop early and close games hit the target width"""
+    executor = sampling.AdaptiveShotExecutor(target_width=0.04, max_shots=8192)
+
+    lopsided = executor.run(binomial_sampler(0.99), sampling.count_home_wins)
+    close = executor.run(binomial_sampler(0.5), sampling.count_home_wins)
+
+    assert lopsided['shots'] < close['shots']
+    for result in (lopsided, close):
+        lower, upper = result['confidence_interval']
+        assert upper - lower <= 0.04
+        assert lower <= result['success_prob'] <= upper
+
+def test_adaptive_shot_budget():
+    """Test sampling stops when the shot budget is used up"""
+    executor = sampling.AdaptiveShotExecutor(target_width=0.001, max_shots=1000, round_shots=300)
+
+    result = executor.run(binomial_sampler(0.5), sampling.count_home_wins)
+
+    assert result['shots'] == 1000
+    assert result['confidence_interval'][1] - result['confidence_interval'][0] > 0.001
+
+def test_momentum_batch():
+    """Test batched momentum scores match the closed-form expectation"""
+    tracker = momentum.NFLQuantumMomentum(None)
+    rng = np.random.default_rng(3)
+    game_data = {
+        f'player_{i}': {'recent_plays': [
+            {'success_rate': rng.random(), 'type': 'FIRST_DOWN', 'time': 25 * t} for t in range(4)
+        ]}
+        for i in range(22)
+    }
+
+    results = tracker.track_momentum_batch(game_data)
+
+    assert len(results) == 22
+    for player, data in game_data.items():
+        q = np.sin(tracker._momentum_angles(data['recent_plays']) / 2) ** 2
+        expected = 0.5 * (q[0] + 2 * q[1] + 4 * q[2]) / 7 + 0.3 * q[3] + 0.2 * q[4]
+        assert results[player]['current_momentum'] == pytest.approx(expected)
+    assert tracker._analyze_momentum_counts({'0000111': 3, '1110000': 1}) == pytest.approx(0.475)
+
+    # The single-team API gives the same exact score, and sampling converges to it
+    single = momentum.NFLQuantumMomentum(None).track_momentum('player_0', game_data['player_0'])
+    assert single['current_momentum'] == results['player_0']['current_momentum']
+    sampler = momentum.NFLQuantumMomentum(NFLQuantumCircuits(backend=backend.NumpyBackend(seed=4)))
+    sampled = sampler.track_momentum('player_0', game_data['player_0'], shots=20000)
+    assert sampled['current_momentum'] == pytest.approx(single['current_momentum'], abs=0.01)
+
+def test_momentum_history_bounded():
+    """Test momentum history keeps fixed memory and evicts quiet teams"""
+    history = momentum.MomentumHistory(retention=4, max_teams=2, span=3)
+
+    for score in (0.2, 0.4, 0.6, 0.8, 1.0):
+        history.push('GB', score)
+    history.push('SF', 0.5)
+
+    assert list(history['GB']) == pytest.approx([0.4, 0.6, 0.8, 1.0])
+    assert history.trend('GB') == pytest.approx(0.2)
+    assert 0 < history.stability('GB') < 1
+
+    history.push('KC', 0.7)
+
+    assert 'GB' not in history and len(history) == 2
+    assert history.get('GB', []) == []
+    assert history.evict_inactive(idle_updates=1) == ['SF']
+
+def dense_reduced_state(amplitudes, traced):
+    """Reference reduced density matrix built from the full |psi><psi|"""
+    n = int(np.log2(len(amplitudes)))
+    rho = np.outer(amplitudes, amplitudes.conj()).reshape((2,) * (2 * n))
+    for count, qubit in enumerate(sorted(traced, reverse=True)):
+        axis = n - count - 1 - qubit
+        rho = np.trace(rho, axis1=axis, axis2=axis + n - count)
+    kept = 2 ** (n - len(traced))
+    return rho.reshape(kept, kept)
+
+def test_state_metrics_match_density_matrix():
+    """Test amplitude metrics against dense density-matrix references"""
+    rng = np.random.default_rng(4)
+    states = [statevector.team_states(rng.random((1, 3)))[0]]
+    random_state = rng.normal(size=1024) + 1j * rng.normal(size=1024)
+    states.append(random_state / np.linalg.norm(random_state))
+
+    for amplitudes in states:
+        rho = np.outer(amplitudes, amplitudes.conj())
+        coherence = np.abs(rho).sum() - np.trace(np.abs(rho))
+        eigenvalues = np.linalg.eigvalsh(dense_reduced_state(amplitudes, (0, 1)))
+        eigenvalues = eigenvalues[eigenvalues > 1e-10]
+
+        assert metrics.l1_coherence(amplitudes) == pytest.approx(coherence)
+        assert metrics.entanglement_entropy(amplitudes) == pytest.approx(-np.sum(eigenvalues * np.log2(eigenvalues)))
+
+def test_product_state_entanglement():
+    """Test a product state has the entropy of its traced factor"""
+    home, away = statevector.team_states(np.random.default_rng(5).random((2, 3)))
+
+    composite = np.kron(home, away)
+
+    assert metrics.entanglement_entropy(composite) == pytest.approx(metrics.entanglement_entropy(away))
+    assert metrics.entanglement_entropy(composite, traced=range(5)) == pytest.approx(0, abs=1e-9)
+
+def test_import_without_qiskit():
+    """Test importing the package modules never imports qiskit"""
+    modules = 'analyzer, backend, bracket, circuits, metrics, momentum, predictor, sampling, statevector'
+    code = f"import sys; from src.ibm_quantum import {modules}; print('qiskit' in sys.modules)"
+
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == 'False'
+
+def test_numpy_backend_sampling():
+    """Test the NumPy backend samples Qiskit-style bitstrings"""
+    probabilities = np.zeros(8)
+    probabilities[[1, 6]] = 0.5
+
+    counts = backend.NumpyBackend(seed=0).sample(probabilities, shots=1000)
+
+    assert set(counts) == {'001', '110'}
+    assert sum(counts.values()) == 1000
+
+def test_team_template_matches_statevector():
+    """Test the Qiskit team template and the NumPy team states agree"""
+    pytest.importorskip('qiskit')
+    Statevector = backend.qiskit_import('qiskit.quantum_info', 'Statevector')
+    circuits = NFLQuantumCircuits(backend=backend.NumpyBackend())
+
+    for metrics in (PACKERS_METRICS, NINERS_METRICS):
+        circuit = circuits.create_team_state_circuit(metrics).remove_final_measurements(inplace=False)
+        expected = Statevector(circuit).data
+        np.testing.assert_allclose(circuits.team_statevector(metrics), expected, atol=1e-12)
+
+def test_backend_without_aer(monkeypatch):
+    """Test a Qiskit without Aer and execute falls back to the NumPy backend"""
+    import importlib.machinery
+    import types
+    newer_qiskit = types.ModuleType('qiskit')
+    newer_qiskit.__spec__ = importlib.machinery.ModuleSpec('qiskit', None)
+    monkeypatch.setitem(sys.modules, 'qiskit', newer_qiskit)
+    backend.qiskit_available.cache_clear()
+    try:
+        assert not backend.qiskit_available()
+        assert isinstance(NFLQuantumCircuits().backend, backend.NumpyBackend)
+    finally:
+        backend.qiskit_available.cache_clear()
+
+def test_offline_predictions():
+    """Test sampled and exact predictions on the NumPy backend"""
+    circuits = NFLQuantumCircuits(backend=backend.NumpyBackend(seed=0))
+    predictor = NFLQuantumPredictor(circuits, NFLQuantumAnalyzer(circuits))
+    exact = circuits.simulate_game(PACKERS_METRICS, NINERS_METRICS)
+
+    sampled = circuits.simulate_game(PACKERS_METRICS, NINERS_METRICS, shots=20000)
+    adaptive = predictor.predict_game_outcome(
+        PACKERS_METRICS, NINERS_METRICS, executor=sampling.AdaptiveShotExecutor(target_width=0.02)
+    )
+
+    assert sampled['home_win_prob'] == pytest.approx(exact['home_win_prob'], abs=0.02)
+    assert adaptive['home_win_prob'] == pytest.approx(exact['home_win_prob'], abs=0.02)
+    assert adaptive['shots'] > 0
+
+def test_offline_playoff_outcomes():
+    """Test the 14-team playoff prediction runs without qiskit"""
+    rng = np.random.default_rng(6)
+    field = [dict(zip(statevector.TEAM_METRICS, values)) for values in rng.random((14, 3))]
+    circuits = NFLQuantumCircuits(backend=backend.NumpyBackend())
+    predictor = NFLQuantumPredictor(circuits, NFLQuantumAnalyzer(circuits))
+
+    outcomes = predictor.predict_playoff_outcomes(field)
+
+    assert [(game['team1'], game['team2']) for game in outcomes] == bracket.first_round_games(14)
+    assert sum(game['team1_advancement'][-1] + game['team2_advancement'][-1] for game in outcomes) < 1
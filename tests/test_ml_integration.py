@@ -1,6 +1,7 @@
 """Test suite for machine learning integration."""
 import pytest
 import numpy as np
+import pandas as pd
 from src.ml.quantum_ml import QuantumMLPredictor
 from src.quantum.state import QuantumState
 
@@ -83,6 +84,33 @@ class TestMLIntegration:
         assert "feature_importance" in metrics
         assert "quantum_confidence" in metrics
         
+    def test_batch_prediction(self, predictor):
+        """Test batch features and predictions match the per-game path."""
+        rng = np.random.default_rng(0)
+        def teams(n):
+            return pd.DataFrame({
+                "quantum_rating": rng.random(n),
+                "entanglement_factor": rng.random(n),
+                "momentum": rng.random(n),
+                "wins": rng.integers(0, 17, n),
+                "points_scored": rng.integers(200, 500, n),
+                "points_allowed": rng.integers(200, 500, n)
+            })
+        home, away = teams(50), teams(50)
+        predictor.train(
+            [{"home_team": home.iloc[i].to_dict(), "away_team": away.iloc[i].to_dict()} for i in range(50)],
+            [1, 0] * 25
+        )
+        
+        features = predictor.prepare_features_batch(home, away)
+        probs = predictor.predict_games_batch({name: home[name].to_numpy() for name in home}, away)
+        
+        assert features.shape == (50, 21)
+        win_prob, _ = predictor.predict_game(home.iloc[3].to_dict(), away.iloc[3].to_dict())
+        assert probs[3] == pytest.approx(win_prob)
+        with pytest.raises(ValueError):
+            predictor.prepare_features_batch({}, away)
+        
     def test_quantum_impact_analysis(self, predictor):
         """Test quantum impact analysis."""
         game_data = {
@@ -144,6 +172,79 @@ class TestMLIntegration:
         
         np.testing.assert_array_almost_equal(pred1, pred2)
         
+    def test_model_cache(self, predictor, tmp_path):
+        """Test an identical training set warm-starts from the artifact cache."""
+        team = {
+            "quantum_rating": 0.85,
+            "entanglement_factor": 0.92,
+            "momentum": 0.78,
+            "wins": 10,
+            "points_scored": 300,
+            "points_allowed": 200
+        }
+        rng = np.random.default_rng(1)
+        training_data = [
+            {
+                "home_team": {**team, "quantum_rating": rating},
+                "away_team": {**team, "momentum": momentum}
+            }
+            for rating, momentum in rng.random((40, 2))
+        ]
+        labels = [1, 0] * 20
+        predictor.train(training_data, labels, cache_dir=tmp_path)
+        artifact = predictor.artifact_path(tmp_path, predictor.training_hash)
+        
+        warm = QuantumMLPredictor()
+        warm.classifier.fit = None  # Must not refit
+        warm.train(training_data, labels, cache_dir=tmp_path)
+        served = QuantumMLPredictor.from_artifact(artifact)
+        
+        assert artifact.exists()
+        assert warm.training_hash == predictor.training_hash
+        expected = predictor.predict_game(team, team)[0]
+        assert warm.predict_game(team, team)[0] == pytest.approx(expected)
+        assert served.predict_game(team, team)[0] == pytest.approx(expected)
+        
+    def test_incremental_training(self, predictor):
+        """Test weekly updates add trees fitted only on the new games."""
+        rng = np.random.default_rng(2)
+        def games(n):
+            teams = [
+                {
+                    "quantum_rating": rating,
+                    "entanglement_factor": 0.9,
+                    "momentum": 0.7,
+                    "wins": 10,
+                    "points_scored": 300,
+                    "points_allowed": 200
+                }
+                for rating in rng.random(2 * n)
+            ]
+            data = [{"home_team": home, "away_team": away} for home, away in zip(teams[0::2], teams[1::2])]
+            return data, [int(game["home_team"]["quantum_rating"] > game["away_team"]["quantum_rating"]) for game in data]
+        history, new_week = games(200), games(16)
+        
+        full = predictor.train(*history, validation=new_week)
+        matrix = predictor.build_training_matrix(history[0], chunk_size=7)
+        update = predictor.update(*new_week, new_trees=5, validation=new_week)
+        
+        assert matrix.shape == (200, 21)
+        assert matrix[50] == pytest.approx(predictor.prepare_features_batch(
+            {name: [history[0][50]["home_team"][name]] for name in history[0][50]["home_team"]},
+            {name: [history[0][50]["away_team"][name]] for name in history[0][50]["away_team"]}
+        )[0])
+        assert full["mode"] == "full" and full["trees"] == 100
+        assert update["mode"] == "incremental" and update["trees"] == 105 and update["games"] == 16
+        assert update["holdout_accuracy"] == pytest.approx(full["accuracy"])
+        
+        # A full retrain after an update goes back to the configured forest
+        retrain = predictor.train(*history)
+        assert retrain["trees"] == 100
+        fresh = QuantumMLPredictor()
+        fresh.train(*history)
+        assert predictor.training_hash == fresh.training_hash
+        assert 0 <= update["accuracy"] <= 1 and update["seconds"] >= 0
+        
     def test_error_handling(self, predictor):
         """Test error handling in ML pipeline."""
         with pytest.raises(ValueError):
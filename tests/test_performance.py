@@ -68,36 +68,31 @@ class TestPerformance:
         assert memory_increase < 100  # Memory increase should be under 100MB
         
     @pytest.mark.benchmark
-    def test_parallel_game_simulation(self, simulator):
+    def test_parallel_game_simulation(self):
         """Test parallel game simulation performance"""
-        import concurrent.futures
+        import os
+        from src.simulation.parallel_runner import ParallelGameRunner
         
-        def simulate_parallel_game(teams):
-            home, away = teams
-            return simulator.simulate_game(home, away)
+        workers = min(os.cpu_count() or 1, 4)
+        if workers < 4:
+            pytest.skip("process-pool speedup needs at least 4 cores")
             
-        team_pairs = [
-            ("GB", "CHI"),
-            ("KC", "SF"),
-            ("TB", "NO"),
-            ("LAR", "SEA")
-        ]
-        
+        games = 400
         start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            results = list(executor.map(simulate_parallel_game, team_pairs))
+        results = ParallelGameRunner(seed=11, workers=workers, chunk_size=25).simulate_games("GB", "CHI", games)
         end_time = time.time()
         
         parallel_time = end_time - start_time
         
         # Run sequential for comparison
         start_time = time.time()
-        sequential_results = [simulate_parallel_game(pair) for pair in team_pairs]
+        sequential_results = ParallelGameRunner(seed=11, workers=1, chunk_size=25).simulate_games("GB", "CHI", games)
         end_time = time.time()
         
         sequential_time = end_time - start_time
         
-        # Parallel should be at least 2x faster
+        # Same games either way, and parallel should be at least 2x faster
+        np.testing.assert_array_equal(results['home_scores'], sequential_results['home_scores'])
         assert parallel_time * 2 < sequential_time
         
     @pytest.mark.benchmark
@@ -183,6 +178,52 @@ class TestPerformance:
         avg_time = (end_time - start_time) / len(drives)
         assert avg_time < 0.01  # Analysis should be under 10ms per drive
 
+    @pytest.mark.benchmark
+    def test_play_terms_performance(self, simulator):
+        """Test sharing probability terms across a play makes plays cheaper"""
+        game = simulator.initialize_game("GB", "CHI")
+        for _ in range(5):
+            simulator.simulate_play(game)
+        situation = simulator.get_game_situation(game)
+        bases = (0.4, 0.5, 0.65, 0.5)  # Draws in a typical completed pass
+        
+        def time_plays(draw_play, plays=5000):
+            start_time = time.perf_counter()
+            for _ in range(plays):
+                draw_play()
+            return (time.perf_counter() - start_time) / plays
+            
+        def per_draw_play():
+            for base in bases:
+                simulator.calculate_quantum_probability(base, game.possession, situation)
+                
+        def per_play_terms():
+            terms = simulator.play_terms(game.possession, situation)
+            for base in bases:
+                simulator.draw_probability(base, terms)
+                
+        uncompiled_time = min(time_plays(per_draw_play) for _ in range(3))
+        compiled_time = min(time_plays(per_play_terms) for _ in range(3))
+        
+        assert compiled_time < uncompiled_time
+        
+    @pytest.mark.benchmark
+    def test_batch_simulation_speedup(self, simulator):
+        """Test batch simulation beats looping simulate_game"""
+        games = 20
+        start_time = time.time()
+        for _ in range(games):
+            simulator.simulate_game("GB", "CHI")
+        loop_time = (time.time() - start_time) / games
+        
+        batch_games = 20000
+        start_time = time.time()
+        simulator.simulate_games_batch("GB", "CHI", batch_games)
+        batch_time = (time.time() - start_time) / batch_games
+        
+        # Batch games should be at least 50x cheaper per game
+        assert batch_time * 50 < loop_time
+
 @pytest.fixture
 def simulator():
     return NFLQuantumSimulator()
@@ -0,0 +1,99 @@
+"""Tests for the quantum core field and analysis engines."""
+import asyncio
+import time
+import pytest
+import numpy as np
+from src.core.quantum_core import PLAYER_STATE_LOW, PLAYER_STATE_SPAN, QuantumCore, QuantumField
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.float16])
+def test_field_statistics(dtype):
+    """Test running field statistics match a full scan of the cube."""
+    field = QuantumField(size=40, dtype=dtype, slab=7, rng=np.random.default_rng(0))
+    
+    field.initialize(0.5)
+    for _ in range(3):
+        field.step(0.05)
+    data = field.data.astype(np.float64)
+    stats = field.statistics()
+    
+    assert field.data.dtype == dtype
+    assert stats["strength"] == pytest.approx(data.mean())
+    assert stats["coherence"] == pytest.approx(data.std())
+    assert stats["energy"] == pytest.approx(data.max())
+    assert 0 <= data.min() and data.max() <= 1
+
+def test_field_is_lazy():
+    """Test a core allocates its field only when it is first used."""
+    core = QuantumCore(field_size=20)
+    
+    assert core.field.nbytes == 0
+    assert core.field.statistics()["strength"] == 0
+    core.field.initialize(0.5, 0, 5)
+    assert core.field_matrix.shape == (20, 20, 20)
+    assert core.field.nbytes == 20 ** 3 * 4
+    assert core.field.statistics()["energy"] == pytest.approx(core.field_matrix[:5].max())
+
+def test_team_analysis():
+    """Test roster analysis draws states in the documented ranges."""
+    core = QuantumCore(field_size=10, rng=np.random.default_rng(1), headless=True)
+    
+    team = asyncio.run(core.analyze_team("GB", [f"GB_{i}" for i in range(53)]))
+    
+    values = np.array([list(vars(state).values()) for state in team.values()])
+    assert len(team) == 53 and len(core.states) == 53
+    assert np.all(values >= PLAYER_STATE_LOW)
+    assert np.all(values < PLAYER_STATE_LOW + PLAYER_STATE_SPAN)
+
+@pytest.mark.benchmark
+def test_league_analysis_speed():
+    """Test analyzing 32 teams x 53 players headless is fast."""
+    core = QuantumCore(field_size=10, headless=True)
+    rosters = {f"team_{t}": [f"team_{t}_{p}" for p in range(53)] for t in range(32)}
+    
+    start_time = time.time()
+    league = asyncio.run(core.analyze_league(rosters))
+    league_time = time.time() - start_time
+    
+    start_time = time.time()
+    for team_id, player_ids in rosters.items():
+        asyncio.run(core.analyze_team(team_id, player_ids))
+    team_time = time.time() - start_time
+    
+    assert sum(len(team) for team in league.values()) == 32 * 53
+    assert league_time < 0.1  # Previously over half a second per team
+    assert team_time < 0.5
+
+def test_formation_optimizer():
+    """Test batched formations and play scoring match the per-player loops."""
+    core = QuantumCore(field_size=10, rng=np.random.default_rng(2), headless=True)
+    rosters = {team: [f"{team}_{i}" for i in range(53)] for team in ["GB", "CHI", "DET"]}
+    league = asyncio.run(core.analyze_league(rosters))
+    asyncio.run(core.analyze_team("GB", rosters["GB"]))
+    
+    grids = core.optimize_formations(list(rosters))
+    for grid, team_id in zip(grids, rosters):
+        expected = np.zeros((11, 11))
+        for player_id in rosters[team_id]:
+            state = core.states[player_id]
+            expected[int(state.coherence * 10), int(state.energy * 10)] = state.field_strength
+        assert np.array_equal(grid, expected)
+    assert np.array_equal(asyncio.run(core.optimize_formation(league["CHI"])), grids[1])
+    
+    conditions = {"weather": 0.4, "crowd": 0.9}
+    base = np.mean([state.coherence * state.energy for state in core.states.values()])
+    expected = min(base + np.mean(grids[0]) * 0.3 + 0.65 * 0.2, 1)
+    assert core.play_count == len(core.states) == 159
+    assert asyncio.run(core.predict_play_success(grids[0], "run", conditions)) == pytest.approx(expected)
+    batch = asyncio.run(core.predict_play_success_batch(grids, ["run", "pass", "run"], [conditions] * 3))
+    assert batch.shape == (3,) and batch[0] == pytest.approx(expected)
+
+def test_duplicate_player_ids():
+    """Test repeated player ids keep one state and a consistent play aggregate."""
+    core = QuantumCore(field_size=10, rng=np.random.default_rng(3), headless=True)
+    team = asyncio.run(core.analyze_team("A", ["p1", "p1", "p2"]))
+    
+    expected = np.mean([state.coherence * state.energy for state in core.states.values()])
+    assert list(team) == ["p1", "p2"]
+    assert core.team_arrays["A"].shape == (2, 5)
+    assert core.team_arrays["A"][0, 0] == team["p1"].coherence
+    assert core.base_play_probability() == pytest.approx(expected)
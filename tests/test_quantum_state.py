@@ -0,0 +1,78 @@
+"""Tests for quantum state batches."""
+import pytest
+import numpy as np
+from src.quantum.league import LeagueMatrix
+from src.quantum.state import QuantumState, QuantumStateBatch
+
+@pytest.fixture
+def batch():
+    rng = np.random.default_rng(0)
+    return QuantumStateBatch(rng.random((32, 4)) * [1, 1, 1, 0.2], rng=rng)
+
+def test_pairwise_matrices_match_states(batch):
+    """Test batch interference and entanglement match the per-state methods."""
+    states = [QuantumState(*row) for row in batch.data]
+    
+    interference = batch.interfere()
+    entanglement = batch.entangle()
+    
+    assert interference.shape == entanglement.shape == (32, 32)
+    for i, j in [(0, 1), (3, 7), (31, 12)]:
+        assert interference[i, j] == pytest.approx(states[i].interfere(states[j]))
+        assert entanglement[i, j] == pytest.approx(states[i].entangle(states[j]))
+
+def test_views_share_memory(batch):
+    """Test state views read and write the batch array without copying."""
+    view = batch[5]
+    
+    view.momentum = 0.25
+    
+    assert isinstance(view, QuantumState)
+    assert batch.momentum[5] == 0.25
+    np.testing.assert_array_equal(view.to_vector(), batch.data[5])
+    assert len(batch.to_states()) == 32
+
+def test_evolve_and_collapse(batch):
+    """Test evolution stays in range and in-place steps reuse the array."""
+    data = batch.data
+    
+    evolved = batch.evolve()
+    batch.evolve(delta_t=0.5, inplace=True)
+    probabilities = batch.collapse()
+    
+    assert evolved.data is not data and batch.data is data
+    assert np.all((batch.data >= 0) & (batch.data <= 1))
+    assert probabilities.shape == (32,)
+    assert np.all((probabilities >= 0) & (probabilities <= 1))
+
+def test_invalid_shape():
+    """Test batches must have one column per state field."""
+    with pytest.raises(ValueError):
+        QuantumStateBatch(np.zeros((4, 3)))
+
+def test_league_matrix_updates():
+    """Test single-team updates match a full recomputation."""
+    rng = np.random.default_rng(1)
+    teams = {f"team_{i}": QuantumState(*rng.random(4)) for i in range(32)}
+    league = LeagueMatrix(teams)
+    league.interference(), league.entanglement()
+    
+    league.update_team("team_7", QuantumState(0.9, 0.8, 0.7, 0.1))
+    expected = LeagueMatrix({**teams, "team_7": QuantumState(0.9, 0.8, 0.7, 0.1)})
+    
+    np.testing.assert_allclose(league.interference(), expected.interference())
+    np.testing.assert_allclose(league.entanglement(), expected.entanglement())
+    assert not league.entanglement().flags.writeable
+
+def test_most_entangled_opponents():
+    """Test the top-k query ranks opponents and skips the team itself."""
+    rng = np.random.default_rng(2)
+    league = LeagueMatrix({f"team_{i}": QuantumState(*rng.random(4)) for i in range(32)})
+    row = league.entanglement()[league.index["team_3"]]
+    
+    top = league.most_entangled("team_3", k=3)
+    
+    assert len(top) == 3 and "team_3" not in [team for team, _ in top]
+    assert [strength for _, strength in top] == sorted(np.delete(row, 3))[::-1][:3]
+    with pytest.raises(ValueError):
+        league.most_entangled("unknown")
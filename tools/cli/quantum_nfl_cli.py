@@ -6,6 +6,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
 from quantum_nfl import QuantumNFL
+from src.simulation.season_simulator import SeasonSimulator, generate_schedule
 
 console = Console()
 
@@ -78,26 +79,31 @@ def rivalry(team1, team2):
     console.print(table)
 
 @cli.command()
-def simulate_season():
+@click.option('--seasons', default=1000, show_default=True, help='Number of seasons to simulate')
+@click.option('--workers', default=None, type=int, help='Worker processes (defaults to all cores)')
+@click.option('--seed', default=None, type=int, help='Root seed for reproducible runs')
+def simulate_season(seasons, workers, seed):
     """Simulate entire NFL season with quantum effects."""
     with Progress() as progress:
         task = progress.add_task("[cyan]Simulating season...", total=100)
         
-        client = QuantumNFL()
-        results = client.simulate_season()
+        engine = SeasonSimulator(seed=seed, workers=workers)
+        results = engine.simulate_seasons(generate_schedule(), n_seasons=seasons)
         
         progress.update(task, advance=100)
     
-    table = Table(title="Season Simulation")
+    table = Table(title=f"Season Simulation ({seasons} seasons)")
     table.add_column("Team", style="cyan")
-    table.add_column("Wins", style="magenta")
-    table.add_column("Quantum Rating", style="blue")
+    table.add_column("Mean Wins", style="magenta")
+    table.add_column("Division Title", style="blue")
+    table.add_column("Playoffs", style="blue")
     
-    for team in sorted(results, key=lambda x: x['wins'], reverse=True):
+    for team in sorted(results['teams'], key=lambda t: results['mean_wins'][t], reverse=True):
         table.add_row(
-            team['name'],
-            str(team['wins']),
-            f"{team['quantum_rating']:.2f}"
+            team,
+            f"{results['mean_wins'][team]:.2f}",
+            f"{results['division_title_prob'][team]:.1%}",
+            f"{results['playoff_prob'][team]:.1%}"
         )
     
     console.print(table)